@@ -3,6 +3,7 @@ Main OPNsense Log Viewer Application component.
 """
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import concurrent.futures
 import os
 import threading
 from datetime import datetime
@@ -12,11 +13,14 @@ import csv
 import types
 import re
 import ipaddress
+from collections import OrderedDict
+
+import numpy as np
 
 from opnsense_log_viewer.services.log_parser import OPNsenseLogParser, LogEntry
 from opnsense_log_viewer.services.config_parser import OPNsenseConfigParser
 from opnsense_log_viewer.services.log_filter import LogFilter
-from opnsense_log_viewer.services.virtual_log_manager import VirtualLogManager
+from opnsense_log_viewer.services.virtual_log_manager import VirtualLogManager, LogColumns
 from opnsense_log_viewer.services.ssh_client import OPNsenseSSHClient, RuleLabelMapper
 from opnsense_log_viewer.services.parallel_filter import OptimizedFilterFunction, ParallelLogFilter, get_cpu_count, get_max_parallel_workers
 from opnsense_log_viewer.components.progress_dialog import ProgressDialog
@@ -28,10 +32,15 @@ from opnsense_log_viewer.constants.app_constants import (
     TAIL_READ_LINES, SAFE_TAIL_THRESHOLD, LOG_TABLE_COLUMNS,
     COLUMN_WIDTHS, COLUMN_HEADERS, FIELD_MAPPING, FILTER_FIELD_OPTIONS,
     FILTER_OPERATOR_OPTIONS, FILTER_LOGIC_OPTIONS, TAG_COLOR_BLOCKED,
-    TAG_COLOR_PASSED, DEFAULT_SSH_PORT, SSH_TIMEOUT, EXPORT_CHUNK_SIZE,
-    TIME_FORMAT, APP_NAME, APP_VERSION, APP_URL
+    TAG_COLOR_PASSED, ACTION_ROW_TAGS, DEFAULT_SSH_PORT, SSH_TIMEOUT,
+    EXPORT_CHUNK_SIZE, TIME_FORMAT, APP_NAME, APP_VERSION, APP_URL,
+    TREE_MATERIALIZE_BATCH
 )
 
+# rid fallback: a 32-char hex token delimited by commas, matched in one
+# C-level pass instead of splitting the line and scanning each part
+_RID_RE = re.compile(r'(?:^|,)\s*([0-9a-fA-F]{32})\s*(?:,|$)')
+
 
 class LogViewerApp:
     """Main OPNsense Log Viewer Application"""
@@ -71,6 +80,57 @@ class LogViewerApp:
 
         # State variables
         self.displayed_entries = []
+        # Column-oriented view of the displayed page for vectorized filters
+        self.displayed_cols = LogColumns.empty()
+        # Virtualized table window: full page rows kept here, only a
+        # window of them materialized as Treeview items
+        self._tree_rows = []
+        self._tree_materialized = 0
+        # Recycled Treeview item ids, reused across page flips via
+        # item() updates instead of delete+insert churn
+        self._tree_iids = []
+        # LRU of parsed pages keyed by (start index, page size, filter
+        # signature): First/Prev/Next within the same filter becomes a
+        # dict hit instead of a re-parse
+        self._page_cache = OrderedDict()
+        self._page_cache_size = VIRTUAL_LOG_CACHE_SIZE
+        self._page_cache_lock = threading.Lock()
+        self._filter_signature = 0
+        # Row-render memoization: enrichment keyed by the IP/port string
+        # (many rows repeat the same endpoints), labels keyed by rid
+        # hash. Cleared when the alias table or rule mapping changes.
+        self._enrich_ip_cache = {}
+        self._enrich_port_cache = {}
+        self._rule_label_cache = {}
+        # {rid: description} copy handed to the parallel filter workers,
+        # rebuilt only when the rule mapper reloads
+        self._rule_labels_mapping_cache = None
+        # strftime output keyed by datetime: log timestamps have second
+        # granularity, so adjacent rows usually share the formatted string
+        self._ts_format_cache = {}
+        # (filter, page, page_size, total) of the last rendered window;
+        # refresh_display short-circuits when it matches
+        self._last_render_key = None
+        # Core counts never change within a session; probe once instead
+        # of per status-bar update
+        self._cpu_count = get_cpu_count()
+        self._max_workers = get_max_parallel_workers()
+        # Total-entry count cached between file/filter changes, and the
+        # last (prev_disabled, next_disabled) pair pushed to Tcl so
+        # unchanged button states skip the config() round-trips
+        self._cached_total_entries = None
+        self._total_entries_str = '0'
+        self._pagination_button_state = None
+        # Speculative warming of the neighbouring pages while the user
+        # reads the current one
+        self._prefetch_exec = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self._prefetch_futures = []
+        # Reused worker for filter application: serializes successive
+        # Apply clicks and lets a still-queued one be cancelled
+        self._filter_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='filter'
+        )
+        self._filter_future = None
         self.current_log_file = None
         self.current_config_file = None
         self.is_loading = False
@@ -88,6 +148,9 @@ class LogViewerApp:
         self.active_filters = []
         self.using_fast_tail = False
 
+        # Column sort state: (column, descending) of the last sort
+        self._sort_state = None
+
         # Time filter variables
         self.time_filter_enabled = tk.BooleanVar()
         self.start_time_var = tk.StringVar()
@@ -107,8 +170,6 @@ class LogViewerApp:
 
     def _inject_threaded_methods(self):
         """Inject threaded methods into VirtualLogManager"""
-        from opnsense_log_viewer.services.virtual_log_manager import VirtualLogManager
-
         if not hasattr(self.virtual_log_manager, '_apply_threaded_filter'):
             self.virtual_log_manager._apply_threaded_filter = types.MethodType(
                 VirtualLogManager._apply_threaded_filter, self.virtual_log_manager
@@ -425,10 +486,11 @@ class LogViewerApp:
             self.log_tree.heading(col, text=COLUMN_HEADERS[col], command=lambda c=col: self.sort_column(c))
             self.log_tree.column(col, width=COLUMN_WIDTHS.get(col, 100))
 
-        # Scrollbars
+        # Scrollbars (vertical scroll goes through the lazy-row proxy)
         v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.log_tree.yview)
         h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.log_tree.xview)
-        self.log_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.log_tree.configure(yscrollcommand=self._on_tree_yscroll, xscrollcommand=h_scrollbar.set)
+        self.v_scrollbar = v_scrollbar
 
         # Grid placement
         self.log_tree.grid(row=0, column=0, sticky='nsew')
@@ -438,6 +500,10 @@ class LogViewerApp:
         tree_frame.grid_columnconfigure(0, weight=1)
         tree_frame.grid_rowconfigure(0, weight=1)
 
+        # Row color tags, configured once rather than on every refresh
+        self.log_tree.tag_configure('blocked', background=TAG_COLOR_BLOCKED)
+        self.log_tree.tag_configure('passed', background=TAG_COLOR_PASSED)
+
         # Bindings
         self.log_tree.bind('<<TreeviewSelect>>', self.on_log_select)
         self.log_tree.bind('<Double-1>', self.on_cell_double_click)
@@ -494,8 +560,13 @@ class LogViewerApp:
 
                 # Load aliases
                 ip_aliases, port_aliases = self.config_parser.parse_aliases_from_xml(file_path)
-                self.config_parser.ip_aliases = ip_aliases
-                self.config_parser.port_aliases = port_aliases
+                self.config_parser.set_aliases(ip_aliases, port_aliases)
+
+                # Memoized enrichments were computed against the old
+                # aliases, and rendered rows embed them
+                self._enrich_ip_cache.clear()
+                self._enrich_port_cache.clear()
+                self._last_render_key = None
 
                 # Store config file path and update labels
                 self.current_config_file = file_path
@@ -527,7 +598,9 @@ class LogViewerApp:
             return
 
         self.is_loading = True
-        self.progress_dialog = ProgressDialog(self.root, "Loading Log File")
+        # Non-modal so the SSH label fetch can be started while the file
+        # loads: both are I/O-bound and overlap instead of serializing
+        self.progress_dialog = ProgressDialog(self.root, "Loading Log File", modal=False)
 
         def load_worker():
             try:
@@ -561,6 +634,8 @@ class LogViewerApp:
 
         self.total_entries_count = total_entries
         self.current_page = 0
+        self._page_cache.clear()
+        self._update_filter_signature()
         self.refresh_display()
 
         # Show memory usage info
@@ -579,15 +654,12 @@ class LogViewerApp:
     def refresh_display(self):
         """Refresh the table display with pagination (memory-efficient)"""
         # If we're in fast tail mode and trying to navigate, exit fast tail mode
-        if getattr(self, 'using_fast_tail', False):
+        was_fast_tail = getattr(self, 'using_fast_tail', False)
+        if was_fast_tail:
             self.using_fast_tail = False
 
         # Use virtual manager for total count
-        if hasattr(self, 'virtual_log_manager') and self.virtual_log_manager.current_file:
-            total_entries = self.virtual_log_manager.get_total_entries()
-        else:
-            # Fallback when no file is loaded
-            total_entries = self.total_entries_count
+        total_entries = self._get_total_entries_cached()
 
         # Calculate pagination - use correct formula
         self.total_pages = max(1, (total_entries + self.page_size - 1) // self.page_size)
@@ -595,6 +667,16 @@ class LogViewerApp:
         if self.current_page >= self.total_pages:
             self.current_page = max(0, self.total_pages - 1)
 
+        # Identical window and filter state means identical rows; skip
+        # the whole rebuild (e.g. on_filter_applied resetting to a page
+        # the user is already on). Fast tail displays other content, so
+        # leaving it always re-renders.
+        render_key = (self._filter_signature, self.current_page,
+                      self.page_size, total_entries)
+        if not was_fast_tail and render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
+
         # Get entries for current page using virtual manager
         start_idx = self.current_page * self.page_size
 
@@ -605,7 +687,7 @@ class LogViewerApp:
                 max_count = min(self.page_size, max(0, total_entries - start_idx))
 
                 if max_count > 0:
-                    self.displayed_entries = self.virtual_log_manager.get_entries(start_idx, max_count)
+                    self.displayed_entries = self._get_page_cached(start_idx, max_count)
                 else:
                     self.displayed_entries = []
             else:
@@ -617,45 +699,7 @@ class LogViewerApp:
             traceback.print_exc()
             self.displayed_entries = []
 
-        # Clear table
-        for item in self.log_tree.get_children():
-            self.log_tree.delete(item)
-
-        # Add entries for current page
-        for entry in self.displayed_entries:
-            # Get rule label for this entry
-            rule_label = self.get_rule_label_for_entry(entry)
-
-            # Enrich with aliases
-            src_display = self.get_enriched_ip(entry.get('src', ''))
-            srcport_display = self.get_enriched_port(entry.get('srcport', ''))
-            dst_display = self.get_enriched_ip(entry.get('dst', ''))
-            dstport_display = self.get_enriched_port(entry.get('dstport', ''))
-
-            values = (
-                entry.timestamp.strftime(TIME_FORMAT) if entry.timestamp else '',
-                entry.get('action', ''),
-                entry.get('interface_display', ''),
-                src_display,
-                srcport_display,
-                dst_display,
-                dstport_display,
-                entry.get('protoname', ''),
-                rule_label
-            )
-
-            # Color coding based on action
-            tags = []
-            if entry.get('action') == 'block':
-                tags.append('blocked')
-            elif entry.get('action') == 'pass':
-                tags.append('passed')
-
-            self.log_tree.insert('', 'end', values=values, tags=tags)
-
-        # Configure colors
-        self.log_tree.tag_configure('blocked', background=TAG_COLOR_BLOCKED)
-        self.log_tree.tag_configure('passed', background=TAG_COLOR_PASSED)
+        self._populate_rows(self.displayed_entries)
 
         # Update pagination info
         self.page_label.config(text=f"Page {self.current_page + 1} of {self.total_pages}")
@@ -666,25 +710,114 @@ class LogViewerApp:
         # Show memory info if using virtual manager
         if hasattr(self, 'virtual_log_manager') and self.virtual_log_manager.current_file:
             memory_info = self.virtual_log_manager.get_memory_info()
-            cpu_count = get_cpu_count()
-            max_workers = get_max_parallel_workers()
+            cpu_count = self._cpu_count
+            max_workers = self._max_workers
 
             filter_status = ""
             if self.virtual_log_manager.is_filtered:
                 filter_status = f" | Filtered with {max_workers} cores"
 
-            self.status_bar.config(text=f"Showing {len(self.displayed_entries):,} entries (Page {self.current_page + 1}/{self.total_pages}) - {total_entries:,} total (~{memory_info['estimated_total_memory_mb']:.1f}MB, {cpu_count} CPU cores){filter_status}")
+            self.status_bar.config(text=f"Showing {len(self.displayed_entries):,} entries (Page {self.current_page + 1}/{self.total_pages}) - {self._total_entries_str} total (~{memory_info['estimated_total_memory_mb']:.1f}MB, {cpu_count} CPU cores){filter_status}")
         else:
-            self.status_bar.config(text=f"Showing {len(self.displayed_entries):,} entries (Page {self.current_page + 1}/{self.total_pages}) - {total_entries:,} total")
+            self.status_bar.config(text=f"Showing {len(self.displayed_entries):,} entries (Page {self.current_page + 1}/{self.total_pages}) - {self._total_entries_str} total")
 
-    def _update_pagination_buttons(self):
-        """Update pagination button states based on current page"""
-        try:
-            # Get real total entries to determine last accessible page
-            if hasattr(self, 'virtual_log_manager') and self.virtual_log_manager.current_file:
+        # Warm the neighbouring pages while the user reads this one
+        self._prefetch_adjacent_pages()
+
+    def _get_page_cached(self, start_idx, count):
+        """Returns a parsed page, served from the LRU cache when possible"""
+        key = (start_idx, count, self._filter_signature)
+
+        with self._page_cache_lock:
+            page = self._page_cache.get(key)
+            if page is not None:
+                self._page_cache.move_to_end(key)
+                return page
+
+        page = self.virtual_log_manager.get_entries(start_idx, count)
+
+        with self._page_cache_lock:
+            self._page_cache[key] = page
+            if len(self._page_cache) > self._page_cache_size:
+                self._page_cache.popitem(last=False)
+        return page
+
+    def _prefetch_adjacent_pages(self):
+        """Warms the pages either side of the current one in the background
+
+        Runs while the user reads the current page, so the next
+        Prev/Next click is usually an LRU hit. Outstanding prefetches
+        are cancelled whenever the filter or page size changes.
+        """
+        if self.using_fast_tail or not self.virtual_log_manager.current_file:
+            return
+
+        for future in self._prefetch_futures:
+            future.cancel()
+        self._prefetch_futures = []
+
+        total_entries = self._get_total_entries_cached()
+        for page in (self.current_page + 1, self.current_page - 1):
+            start_idx = page * self.page_size
+            if page < 0 or start_idx >= total_entries:
+                continue
+            count = min(self.page_size, total_entries - start_idx)
+            self._prefetch_futures.append(
+                self._prefetch_exec.submit(self._get_page_cached, start_idx, count)
+            )
+
+    def _update_filter_signature(self):
+        """Recomputes the page-cache key for the active filter state
+
+        Hashed once per filter change, not per page flip; flipping
+        filters moves subsequent lookups to fresh keys so stale pages
+        age out of the LRU naturally.
+        """
+        for future in self._prefetch_futures:
+            future.cancel()
+        self._prefetch_futures = []
+        # Filter/file changes move the total entry count and invalidate
+        # the rendered window
+        self._cached_total_entries = None
+        self._last_render_key = None
+
+        expression = self.log_filter.expression
+        self._filter_signature = hash((
+            self.current_log_file,
+            self.virtual_log_manager.is_filtered,
+            tuple(
+                (c.field, c.operator, c.value, c.case_sensitive)
+                for c in expression.conditions
+            ),
+            tuple(expression.operators),
+            tuple(expression.negations),
+            self.log_filter.time_range_start,
+            self.log_filter.time_range_end,
+        ))
+
+    def _get_total_entries_cached(self):
+        """Total entry count, cached until the file or filter changes
+
+        Pagination callbacks run on every page flip; re-asking the
+        virtual manager each time is redundant because the total only
+        moves when a file is (re)loaded or a filter is applied, both of
+        which invalidate via _update_filter_signature.
+        """
+        total_entries = self._cached_total_entries
+        if total_entries is None:
+            if self.virtual_log_manager.current_file:
                 total_entries = self.virtual_log_manager.get_total_entries()
             else:
                 total_entries = self.total_entries_count
+            self._cached_total_entries = total_entries
+            # Grouped formatting re-runs per status-bar update otherwise
+            self._total_entries_str = f"{total_entries:,}"
+        return total_entries
+
+    def _update_pagination_buttons(self):
+        """Update pagination button states based on current page"""
+        try:
+            total_entries = self._get_total_entries_cached()
 
             # Calculate last accessible page
             if total_entries > 0:
@@ -692,22 +825,22 @@ class LogViewerApp:
             else:
                 last_page = 0
 
-            # Enable/disable buttons based on current position
-            # First and Previous buttons
-            if self.current_page <= 0:
-                self.first_button.config(state='disabled')
-                self.prev_button.config(state='disabled')
-            else:
-                self.first_button.config(state='normal')
-                self.prev_button.config(state='normal')
+            # Enable/disable buttons based on current position; skip the
+            # Tcl config() calls entirely when nothing changed
+            prev_disabled = self.current_page <= 0
+            next_disabled = self.current_page >= last_page
+            state = (prev_disabled, next_disabled)
+            if state == self._pagination_button_state:
+                return
+            self._pagination_button_state = state
 
-            # Next and Last buttons
-            if self.current_page >= last_page:
-                self.next_button.config(state='disabled')
-                self.last_button.config(state='disabled')
-            else:
-                self.next_button.config(state='normal')
-                self.last_button.config(state='normal')
+            prev_state = 'disabled' if prev_disabled else 'normal'
+            self.first_button.config(state=prev_state)
+            self.prev_button.config(state=prev_state)
+
+            next_state = 'disabled' if next_disabled else 'normal'
+            self.next_button.config(state=next_state)
+            self.last_button.config(state=next_state)
 
         except Exception as e:
             print(f"Error updating pagination buttons: {e}")
@@ -715,10 +848,7 @@ class LogViewerApp:
     def _get_total_pages(self):
         """Calculate total pages based on current data"""
         try:
-            if hasattr(self, 'virtual_log_manager') and self.virtual_log_manager.current_file:
-                total_entries = self.virtual_log_manager.get_total_entries()
-            else:
-                total_entries = self.total_entries_count
+            total_entries = self._get_total_entries_cached()
 
             # Ensure total_entries is valid
             if not isinstance(total_entries, int) or total_entries < 0:
@@ -750,10 +880,7 @@ class LogViewerApp:
     def next_page(self):
         """Go to next page - SAFE VERSION"""
         # RADICAL FIX: Never try to go beyond a safe threshold
-        if hasattr(self, 'virtual_log_manager') and self.virtual_log_manager.current_file:
-            total_entries = self.virtual_log_manager.get_total_entries()
-        else:
-            total_entries = self.total_entries_count
+        total_entries = self._get_total_entries_cached()
 
         # Calculate safe last page (avoid the problematic very last pages)
         safe_last_page = max(0, ((total_entries - SAFE_TAIL_THRESHOLD) // self.page_size))
@@ -830,56 +957,133 @@ class LogViewerApp:
     def _update_table_directly(self):
         """Update the table display directly without refresh_display"""
         try:
-            # Clear table
-            for item in self.log_tree.get_children():
-                self.log_tree.delete(item)
-
-            # Add entries for current page
-            for entry in self.displayed_entries:
-                # Get rule label for this entry
-                rule_label = self.get_rule_label_for_entry(entry)
-
-                # Enrich with aliases
-                src_display = self.get_enriched_ip(entry.get('src', ''))
-                srcport_display = self.get_enriched_port(entry.get('srcport', ''))
-                dst_display = self.get_enriched_ip(entry.get('dst', ''))
-                dstport_display = self.get_enriched_port(entry.get('dstport', ''))
-
-                values = (
-                    entry.timestamp.strftime(TIME_FORMAT) if entry.timestamp else '',
-                    entry.get('action', ''),
-                    entry.get('interface_display', ''),
-                    src_display,
-                    srcport_display,
-                    dst_display,
-                    dstport_display,
-                    entry.get('protoname', ''),
-                    rule_label
-                )
-
-                # Color coding based on action
-                tags = []
-                if entry.get('action') == 'block':
-                    tags.append('blocked')
-                elif entry.get('action') == 'pass':
-                    tags.append('passed')
-
-                self.log_tree.insert('', 'end', values=values, tags=tags)
-
-            # Configure colors
-            self.log_tree.tag_configure('blocked', background=TAG_COLOR_BLOCKED)
-            self.log_tree.tag_configure('passed', background=TAG_COLOR_PASSED)
-
+            self._populate_rows(self.displayed_entries)
         except Exception as e:
             print(f"Error updating table: {e}")
             import traceback
             traceback.print_exc()
 
+    def _populate_rows(self, entries):
+        """Single table-population path shared by every refresh route
+
+        Keeps the column-oriented view in sync with the page buffer and
+        repopulates the virtualized table window, so hot-loop changes
+        apply to the paginated and direct (fast tail, sort) paths alike.
+        """
+        self.displayed_cols = LogColumns.from_entries(entries)
+        self._set_tree_rows(entries)
+
+    def _build_tree_row(self, entry):
+        """Builds the (values, tags) tuple for one entry"""
+        # Hoist attribute lookups: each self./entry. dereference is a
+        # dict probe repeated for every rendered row
+        get = entry.get
+        get_ip = self.get_enriched_ip
+        get_port = self.get_enriched_port
+        timestamp = entry.timestamp
+        action = get('action', '')
+
+        if timestamp:
+            ts_cache = self._ts_format_cache
+            ts_str = ts_cache.get(timestamp)
+            if ts_str is None:
+                if len(ts_cache) > 4096:
+                    ts_cache.clear()
+                ts_str = ts_cache[timestamp] = timestamp.strftime(TIME_FORMAT)
+        else:
+            ts_str = ''
+
+        values = (
+            ts_str,
+            action,
+            get('interface_display', ''),
+            get_ip(get('src', '')),
+            get_port(get('srcport', '')),
+            get_ip(get('dst', '')),
+            get_port(get('dstport', '')),
+            get('protoname', ''),
+            self.get_rule_label_for_entry(entry)
+        )
+
+        # Color coding based on action
+        return values, ACTION_ROW_TAGS.get(action, ())
+
+    def _set_tree_rows(self, entries):
+        """Replaces the table content, materializing only the first window
+
+        Treeview.insert is one Tcl round-trip per row, so inserting a full
+        2500-5000 row page dominates page-flip latency. Entries beyond the
+        first batch stay in self._tree_rows and are rendered on demand as
+        the user scrolls toward them — rendering is lazy too, so label
+        lookup, alias enrichment and strftime run only for rows the user
+        actually scrolls past.
+
+        Existing items are recycled rather than deleted and re-created:
+        an in-place item() update is one Tcl call where delete+insert is
+        two plus the Tcl object churn.
+        """
+        selection = self.log_tree.selection()
+        if selection:
+            self.log_tree.selection_remove(*selection)
+
+        self._tree_rows = entries
+        self._tree_materialized = 0
+        self._materialize_tree_rows(TREE_MATERIALIZE_BATCH)
+
+        # Surplus recycled rows still hold the previous page; drop them
+        iids = self._tree_iids
+        if len(iids) > self._tree_materialized:
+            self.log_tree.delete(*iids[self._tree_materialized:])
+            del iids[self._tree_materialized:]
+
+        self.log_tree.yview_moveto(0)
+
+    def _materialize_tree_rows(self, count):
+        """Renders and inserts the next batch of pending rows
+
+        Calls straight into Tcl rather than through Treeview.insert:
+        the wrapper re-parses its options per call, which is pure
+        overhead when inserting hundreds of identically-shaped rows.
+        _tkinter marshals the values/tags tuples to Tcl lists itself,
+        so no manual quoting is involved.
+        """
+        entries = self._tree_rows
+        end = min(self._tree_materialized + count, len(entries))
+        tree = self.log_tree._w
+        call = self.log_tree.tk.call
+        build_row = self._build_tree_row
+        iids = self._tree_iids
+        pool_size = len(iids)
+
+        for i in range(self._tree_materialized, end):
+            values, tags = build_row(entries[i])
+            if i < pool_size:
+                # Recycle the item left over from the previous page
+                call(tree, 'item', iids[i], '-values', values, '-tags', tags)
+            else:
+                iids.append(
+                    call(tree, 'insert', '', 'end', '-values', values, '-tags', tags)
+                )
+
+        self._tree_materialized = end
+
+    def _on_tree_yscroll(self, first, last):
+        """yscrollcommand proxy that materializes rows near the viewport"""
+        if float(last) > 0.8 and self._tree_materialized < len(self._tree_rows):
+            self._materialize_tree_rows(TREE_MATERIALIZE_BATCH)
+
+        if hasattr(self, 'v_scrollbar'):
+            self.v_scrollbar.set(first, last)
+
     def on_page_size_change(self, event=None):
         """Handle page size change"""
         try:
             self.page_size = int(self.page_size_var.get())
             self.current_page = 0
+            # In-flight prefetches target the old page size
+            for future in self._prefetch_futures:
+                future.cancel()
+            self._prefetch_futures = []
             self.refresh_display()
         except ValueError:
             pass
@@ -1044,10 +1248,13 @@ class LogViewerApp:
         # Create optimized filter function
         # Check if Label filters are present
         has_label_filters = any(
-            hasattr(condition, 'field') and condition.field == '__label__'
+            condition.field == '__label__'
             for condition in self.log_filter.expression.conditions
         )
 
+        # Run cheap conditions first so short-circuiting skips regex work
+        self.log_filter.expression.optimize()
+
         # Create filter function
         combined_filter = OptimizedFilterFunction(
             self.log_filter,
@@ -1059,6 +1266,16 @@ class LogViewerApp:
         # Allow multiprocessing
         use_parallel = True
 
+        # Prepare label mapping for multiprocessing: a plain
+        # {rid: description} dict, copied once per rule-mapper load
+        # rather than per Apply click (and on this thread, not the
+        # worker, so the filter starts immediately)
+        rule_labels_mapping = None
+        if has_label_filters and self.rule_labels_loaded:
+            if self._rule_labels_mapping_cache is None and hasattr(self.rule_mapper, 'label_descriptions'):
+                self._rule_labels_mapping_cache = dict(self.rule_mapper.label_descriptions)
+            rule_labels_mapping = self._rule_labels_mapping_cache
+
         # Show progress dialog for filtering
         self.progress_dialog = ProgressDialog(self.root, "Applying Filters")
 
@@ -1068,15 +1285,6 @@ class LogViewerApp:
                     if not self.progress_dialog.cancelled:
                         self.progress_dialog.update_text(message)
 
-                # Prepare label mapping for multiprocessing
-                rule_labels_mapping = None
-                if has_label_filters and self.rule_labels_loaded:
-                    # Create a simple dictionary {rid: description} for serialization
-                    rule_labels_mapping = {}
-                    if hasattr(self.rule_mapper, 'label_descriptions'):
-                        for label_hash, description in self.rule_mapper.label_descriptions.items():
-                            rule_labels_mapping[label_hash] = description
-
                 # Apply filter using virtual manager with optimized label handling
                 if use_parallel and has_label_filters:
                     # Use multiprocessing with label mapping
@@ -1097,9 +1305,11 @@ class LogViewerApp:
             except Exception as e:
                 self.root.after(0, lambda: self.on_filter_error(str(e)))
 
-        filter_thread = threading.Thread(target=filter_worker)
-        filter_thread.daemon = True
-        filter_thread.start()
+        # Queue on the reused filter worker; cancel a predecessor that
+        # has not started yet so rapid Apply clicks do not pile up
+        if self._filter_future is not None:
+            self._filter_future.cancel()
+        self._filter_future = self._filter_executor.submit(filter_worker)
 
     def on_filter_applied(self):
         """Called when filters are applied"""
@@ -1108,6 +1318,7 @@ class LogViewerApp:
             self.progress_dialog = None
 
         self.current_page = 0
+        self._update_filter_signature()
         self.refresh_display()
 
     def on_filter_error(self, error_message):
@@ -1131,6 +1342,7 @@ class LogViewerApp:
         if hasattr(self, 'virtual_log_manager') and self.virtual_log_manager.current_file:
             self.virtual_log_manager.clear_filter()
             self.current_page = 0
+            self._update_filter_signature()
             self.refresh_display()
 
     def apply_preset_filter(self, preset_name):
@@ -1183,8 +1395,49 @@ class LogViewerApp:
         self.details_text.insert(1.0, details)
 
     def sort_column(self, col):
-        """Sort column (placeholder for future implementation)"""
-        pass
+        """Sort the displayed page by a column (click again to reverse)
+
+        Numeric and enum columns sort through np.argsort on the
+        LogColumns arrays — a C sort on contiguous data — and the
+        entries/rows are reordered by the resulting permutation. Only
+        the current page is sorted; the file order itself is untouched.
+        """
+        if not self.displayed_entries:
+            return
+
+        cols = self.displayed_cols
+        column_keys = {
+            'timestamp': cols.ts,
+            'action': cols.action,
+            'proto': cols.proto,
+            'src': cols.src,
+            'dst': cols.dst,
+            'srcport': cols.srcport,
+            'dstport': cols.dstport,
+        }
+
+        key = column_keys.get(col)
+        if key is None:
+            # String-valued columns sort on their rendered values
+            if col == 'interface':
+                key = np.array([e.get('interface_display', '') or '' for e in self.displayed_entries])
+            elif col == 'label':
+                key = np.array([self.get_rule_label_for_entry(e) or '' for e in self.displayed_entries])
+            else:
+                return
+
+        order = np.argsort(key, kind='stable')
+        descending = self._sort_state == (col, False)
+        if descending:
+            order = order[::-1]
+        self._sort_state = (col, descending)
+
+        self.displayed_entries = [self.displayed_entries[i] for i in order]
+        self.displayed_cols = cols.take(order)
+        self._set_tree_rows(self.displayed_entries)
+        # The window now shows sorted rows; force the next refresh to
+        # rebuild rather than short-circuit on an unchanged key
+        self._last_render_key = None
 
     def export_results(self):
         """Export filtered results with progress dialog"""
@@ -1223,90 +1476,90 @@ class LogViewerApp:
         # Show progress dialog
         self.progress_dialog = ProgressDialog(self.root, "Exporting Data")
 
-        def export_worker():
-            """Export worker thread"""
-            try:
-                # Get all current filtered entries with progress updates
-                all_filtered_entries = []
-
-                if self.virtual_log_manager.is_filtered:
-                    # Export filtered entries
-                    total_filtered = len(self.virtual_log_manager.filtered_indices)
-
-                    # Process in chunks with progress updates
-                    for start_idx in range(0, total_filtered, EXPORT_CHUNK_SIZE):
-                        if self.progress_dialog.cancelled:
-                            return
+        def iter_chunks():
+            """Yields entry chunks with progress updates, honoring cancel
 
-                        # Update progress
-                        self.progress_dialog.update_text(f"Retrieving data: {start_idx:,}/{total_filtered:,} entries")
+            Chunks are streamed straight to the output file, so peak
+            memory stays at one chunk instead of the whole filtered set.
+            A single-worker pool fetches chunk N+1 while the caller is
+            serializing chunk N, overlapping read/parse with encoding.
+            """
+            if self.virtual_log_manager.is_filtered:
+                # Export filtered entries
+                total_filtered = len(self.virtual_log_manager.filtered_indices)
+                keys = list(range(0, total_filtered, EXPORT_CHUNK_SIZE))
 
-                        chunk_entries = self.virtual_log_manager._get_filtered_entries(start_idx, EXPORT_CHUNK_SIZE)
-                        all_filtered_entries.extend(chunk_entries)
+                def fetch(start_idx):
+                    return self.virtual_log_manager._get_filtered_entries(start_idx, EXPORT_CHUNK_SIZE)
 
-                else:
-                    # Export all entries
-                    total_chunks = (total_entries + 999) // 1000
+                def label(start_idx):
+                    return f"Exporting: {start_idx:,}/{total_filtered:,} entries"
+            else:
+                # Export all entries
+                keys = list(range((total_entries + 999) // 1000))
+                fetch = self.virtual_log_manager.get_chunk
 
-                    for chunk_id in range(total_chunks):
-                        if self.progress_dialog.cancelled:
-                            return
+                def label(chunk_id):
+                    return f"Exporting: {chunk_id * 1000:,}/{total_entries:,} entries"
 
-                        # Update progress
-                        current_entries = chunk_id * 1000
-                        self.progress_dialog.update_text(f"Retrieving data: {current_entries:,}/{total_entries:,} entries")
+            if not keys:
+                return
 
-                        chunk_entries = self.virtual_log_manager.get_chunk(chunk_id)
-                        all_filtered_entries.extend(chunk_entries)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(fetch, keys[0])
+                for i, key in enumerate(keys):
+                    if self.progress_dialog.cancelled:
+                        return
 
-                if self.progress_dialog.cancelled:
-                    return
+                    self.progress_dialog.update_text(label(key))
+                    chunk_entries = future.result()
+                    if i + 1 < len(keys):
+                        future = executor.submit(fetch, keys[i + 1])
+                    yield chunk_entries
 
-                # Write to file with progress
-                self.progress_dialog.update_text("Writing to file...")
+        def export_worker():
+            """Export worker thread"""
+            try:
+                exported = 0
 
                 if file_path.endswith('.json'):
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        data = []
-                        for i, entry in enumerate(all_filtered_entries):
-                            if self.progress_dialog.cancelled:
-                                return
-
-                            # Update progress for data processing (50-75%)
-                            if i % 100 == 0:
-                                self.progress_dialog.update_text(f"Processing data: {i:,}/{len(all_filtered_entries):,} entries")
-
-                            data.append(entry.parsed_data)
-
-                        if self.progress_dialog.cancelled:
-                            return
-
-                        # Update progress for JSON serialization (75-100%)
-                        self.progress_dialog.update_text("Writing JSON file...")
-                        json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+                    # 1MB buffer: far fewer write syscalls on big exports
+                    with open(file_path, 'w', buffering=1 << 20, encoding='utf-8') as f:
+                        f.write('[\n')
+                        for chunk_entries in iter_chunks():
+                            for entry in chunk_entries:
+                                if exported:
+                                    f.write(',\n')
+                                # parsed_data holds only strings (the parser
+                                # keeps the raw timestamp text), so the C
+                                # encoder never needs a default= fallback
+                                f.write(json.dumps(entry.parsed_data, ensure_ascii=False))
+                                exported += 1
+                        f.write('\n]\n')
 
                 elif file_path.endswith('.csv'):
-                    with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                        if all_filtered_entries:
-                            # Use keys from first element for headers
-                            fieldnames = all_filtered_entries[0].parsed_data.keys()
-                            writer = csv.DictWriter(f, fieldnames=fieldnames)
-                            writer.writeheader()
-
-                            for i, entry in enumerate(all_filtered_entries):
-                                if self.progress_dialog.cancelled:
-                                    return
-
-                                # Update progress for CSV writing (50-100%)
-                                if i % 100 == 0:
-                                    self.progress_dialog.update_text(f"Writing CSV: {i:,}/{len(all_filtered_entries):,} entries")
-
-                                writer.writerow(entry.parsed_data)
+                    with open(file_path, 'w', buffering=1 << 20, newline='', encoding='utf-8') as f:
+                        # Positional csv.writer instead of DictWriter:
+                        # no per-row fieldname set checks, rows built by
+                        # one comprehension over prebound keys
+                        writer = csv.writer(f)
+                        fieldnames = None
+                        for chunk_entries in iter_chunks():
+                            if fieldnames is None and chunk_entries:
+                                # Use keys from first element for headers
+                                fieldnames = list(chunk_entries[0].parsed_data.keys())
+                                writer.writerow(fieldnames)
+                            if fieldnames is not None:
+                                writer.writerows(
+                                    [entry.parsed_data.get(key, '') for key in fieldnames]
+                                    for entry in chunk_entries
+                                )
+                                exported += len(chunk_entries)
 
                 if not self.progress_dialog.cancelled:
                     # Success - update UI in main thread
                     filter_status = "with filters applied" if self.virtual_log_manager.is_filtered else "all entries"
-                    self.root.after(0, lambda: self.on_export_success(file_path, len(all_filtered_entries), filter_status))
+                    self.root.after(0, lambda: self.on_export_success(file_path, exported, filter_status))
 
             except Exception as e:
                 # Error - update UI in main thread
@@ -1347,11 +1600,13 @@ class LogViewerApp:
         text_widget = scrolledtext.ScrolledText(interfaces_window, wrap=tk.WORD)
         text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        interfaces_text = "=== INTERFACE MAPPING ===\n\n"
-        for physical, logical in self.log_parser.interface_mapping.items():
-            interfaces_text += f"{physical} -> {logical}\n"
+        lines = ["=== INTERFACE MAPPING ===", ""]
+        lines.extend(
+            f"{physical} -> {logical}"
+            for physical, logical in self.log_parser.interface_mapping.items()
+        )
 
-        text_widget.insert(1.0, interfaces_text)
+        text_widget.insert(1.0, "\n".join(lines) + "\n")
 
     def show_about(self):
         """Show about dialog"""
@@ -1420,6 +1675,11 @@ class LogViewerApp:
         """Handle successful SSH connection and label extraction"""
         self.ssh_connected = True
         self.rule_labels_loaded = True
+        # Labels memoized before (re)connection are stale, and rendered
+        # rows embed them
+        self._rule_label_cache.clear()
+        self._rule_labels_mapping_cache = None
+        self._last_render_key = None
 
         # Update UI
         self.ssh_connect_button.config(state='normal', text="Reconnect")
@@ -1477,8 +1737,11 @@ class LogViewerApp:
         label_hash = self.extract_label_hash_from_entry(entry)
 
         if label_hash:
-            description = self.rule_mapper.get_rule_description_by_hash(label_hash)
-            return description if description else ""
+            description = self._rule_label_cache.get(label_hash)
+            if description is None:
+                description = self.rule_mapper.get_rule_description_by_hash(label_hash) or ""
+                self._rule_label_cache[label_hash] = description
+            return description
 
         return ""
 
@@ -1490,40 +1753,45 @@ class LogViewerApp:
         if hasattr(entry, 'parsed_data') and 'rid' in entry.parsed_data:
             return str(entry.parsed_data['rid'])
 
-        # Fallback: try to extract from the raw line using regex
+        # Fallback: look for a 32-character hexadecimal string (MD5 hash
+        # format) in the raw line
         if hasattr(entry, 'raw_line'):
-            # Split by comma and look for potential rid (32-char hex string)
-            parts = entry.raw_line.split(',')
-            for part in parts:
-                part = part.strip()
-                # Check if it's a 32-character hexadecimal string (MD5 hash format)
-                if len(part) == 32 and all(c in '0123456789abcdef' for c in part.lower()):
-                    return part
+            match = _RID_RE.search(entry.raw_line)
+            if match:
+                return match.group(1)
 
         return None
 
     def get_enriched_ip(self, ip: str) -> str:
-        """Enriches an IP with its alias if available"""
+        """Enriches an IP with its alias if available
+
+        Results are memoized per IP string: the network-membership scan
+        below parses every CIDR alias, and the same endpoints repeat
+        across thousands of rendered rows.
+        """
         if not ip or not hasattr(self.config_parser, 'ip_aliases'):
             return ip
 
+        cached = self._enrich_ip_cache.get(ip)
+        if cached is not None:
+            return cached
+
+        result = self._enrich_ip_uncached(ip)
+        self._enrich_ip_cache[ip] = result
+        return result
+
+    def _enrich_ip_uncached(self, ip: str) -> str:
         # Search for exact alias
         alias = self.config_parser.get_ip_alias(ip)
         if alias:
             return f"{ip} ({alias})"
 
-        # If no exact alias, search in networks
+        # If no exact alias, search in networks (interval bisect, not a
+        # per-call scan over every configured CIDR)
         # Format: "ip (ALIAS)" if found, otherwise just "ip"
-        for network, alias_name in self.config_parser.ip_aliases.items():
-            if '/' in network:
-                # It's a network, check if IP belongs to the network
-                try:
-                    ip_obj = ipaddress.ip_address(ip)
-                    network_obj = ipaddress.ip_network(network, strict=False)
-                    if ip_obj in network_obj:
-                        return f"{ip} ({alias_name})"
-                except:
-                    continue
+        alias_name = self.config_parser.get_network_alias(ip)
+        if alias_name:
+            return f"{ip} ({alias_name})"
 
         return ip
 
@@ -1532,9 +1800,12 @@ class LogViewerApp:
         if not port or not hasattr(self.config_parser, 'port_aliases'):
             return port
 
+        cached = self._enrich_port_cache.get(port)
+        if cached is not None:
+            return cached
+
         # Search for alias
         alias = self.config_parser.get_port_alias(port)
-        if alias:
-            return f"{port} ({alias})"
-
-        return port
+        result = f"{port} ({alias})" if alias else port
+        self._enrich_port_cache[port] = result
+        return result
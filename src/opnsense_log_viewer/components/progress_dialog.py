@@ -1,20 +1,29 @@
 """
 Progress dialog component for long-running operations.
 """
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk
 
+# Minimum interval between text updates; workers report far more often
+# than a human can read
+UPDATE_INTERVAL = 0.05
+
 
 class ProgressDialog:
     """Progress dialog for long operations"""
 
-    def __init__(self, parent, title="Loading..."):
+    def __init__(self, parent, title="Loading...", modal=True):
         """
         Initialize progress dialog.
 
         Args:
             parent: Parent window
             title: Dialog title
+            modal: Whether to grab all input while the dialog is open.
+                Non-modal dialogs let independent work (e.g. the SSH
+                label fetch) be started while this operation runs.
         """
         self.parent = parent
         self.dialog = tk.Toplevel(parent)
@@ -22,7 +31,8 @@ class ProgressDialog:
         self.dialog.geometry("400x100")
         self.dialog.resizable(False, False)
         self.dialog.transient(parent)
-        self.dialog.grab_set()
+        if modal:
+            self.dialog.grab_set()
 
         # Center the dialog
         self.dialog.update_idletasks()
@@ -40,20 +50,50 @@ class ProgressDialog:
         self.cancel_button = ttk.Button(self.dialog, text="Cancel", command=self.cancel)
         self.cancel_button.pack(pady=5)
 
-        self.cancelled = False
+        # Event rather than a plain bool: workers poll this from other
+        # threads, and an Event makes the cross-thread handoff explicit
+        self.cancel_event = threading.Event()
+        self._last_update = 0.0
+
+    @property
+    def cancelled(self):
+        """Whether the user cancelled; safe to poll from worker threads"""
+        return self.cancel_event.is_set()
 
-    def update_text(self, text):
+    def update_text(self, text, force=False):
         """
         Update dialog text.
 
+        Safe to call from worker threads: the widget mutation is
+        marshalled to the Tk main loop via after(), and updates arriving
+        within UPDATE_INTERVAL of the previous one are dropped so tight
+        loops do not flood the event queue.
+
         Args:
             text: New text to display
+            force: Bypass throttling (phase-boundary messages)
         """
-        self.label.config(text=text)
+        now = time.monotonic()
+        if not force and now - self._last_update < UPDATE_INTERVAL:
+            return
+        self._last_update = now
+
+        try:
+            self.parent.after(0, self._set_text, text)
+        except tk.TclError:
+            # Main loop already torn down
+            pass
+
+    def _set_text(self, text):
+        try:
+            self.label.config(text=text)
+        except tk.TclError:
+            # Dialog closed between scheduling and delivery
+            pass
 
     def cancel(self):
         """Cancel the operation"""
-        self.cancelled = True
+        self.cancel_event.set()
         self.close()
 
     def close(self):
@@ -9,6 +9,7 @@ DEFAULT_WINDOW_HEIGHT = 1000
 # Pagination
 DEFAULT_PAGE_SIZE = 1000
 PAGE_SIZE_OPTIONS = ['100', '500', '1000', '2500', '5000']
+TREE_MATERIALIZE_BATCH = 200  # Rows inserted into the Treeview per scroll step
 
 # Virtual Log Manager
 VIRTUAL_LOG_CHUNK_SIZE = 1000
@@ -81,6 +82,12 @@ PRESET_FILTER_UDP = 'udp'
 TAG_COLOR_BLOCKED = '#ffcccc'
 TAG_COLOR_PASSED = '#ccffcc'
 
+# Row tags per action, precomputed for the render loop
+ACTION_ROW_TAGS = {
+    'block': ('blocked',),
+    'pass': ('passed',),
+}
+
 # SSH connection
 DEFAULT_SSH_PORT = 22
 SSH_TIMEOUT = 10
@@ -2,21 +2,71 @@
 OPNsense XML configuration parser for interface mapping and firewall rules
 """
 import xml.etree.ElementTree as ET
+import ipaddress
 import os
+import re
+from bisect import bisect_right
 from typing import Dict, Optional
 
 from opnsense_log_viewer.exceptions import FileOperationError, ParseError
 from opnsense_log_viewer.utils.logging_config import get_logger, log_exception
 
+# lxml is a declared dependency; its libxml2 tokenizer parses multi-MB
+# config.xml files several times faster than the stdlib parser. Keep the
+# stdlib as a fallback so a partial install still works.
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:
+    _lxml_etree = None
+
+if _lxml_etree is not None:
+    _XML_PARSE_ERRORS = (ET.ParseError, _lxml_etree.XMLSyntaxError)
+else:
+    _XML_PARSE_ERRORS = (ET.ParseError,)
+
+
+def _parse_xml_root(xml_file_path: str):
+    """Parses an XML file and returns its root element
+
+    Both parsers expose the same find/findall/iteration API on the
+    returned elements, so callers are parser-agnostic.
+    """
+    if _lxml_etree is not None:
+        if not os.path.exists(xml_file_path):
+            # lxml reports missing files as a generic OSError; keep the
+            # callers' FileNotFoundError handling meaningful
+            raise FileNotFoundError(xml_file_path)
+        return _lxml_etree.parse(xml_file_path).getroot()
+    return ET.parse(xml_file_path).getroot()
+
 logger = get_logger(__name__)
 
+# Alias content tokenizer: entries are separated by commas and/or
+# newlines, and tokens (IPs, networks, ports, hostnames) never contain
+# whitespace. One C-level split replaces the replace+split+strip chain,
+# which copied large URL-table contents twice.
+_ALIAS_SPLIT_RE = re.compile(r'[,\s]+')
+
 class OPNsenseConfigParser:
     """OPNsense XML configuration parser"""
     
     def __init__(self):
         self.interface_mapping = {}
         self.ip_aliases = {}    # ip/network -> alias_name
-        self.port_aliases = {}  # port -> alias_name
+        self.port_aliases = {}  # individual port -> alias_name
+        self.port_alias_ranges = []  # (start, end, alias_name) per port range
+        # Sorted (family, lo) interval arrays over the CIDR aliases,
+        # built lazily for get_network_alias
+        self._network_ranges = None
+        # Same, over port_alias_ranges, for get_port_alias
+        self._port_ranges = None
+
+    def set_aliases(self, ip_aliases: dict, port_aliases: dict):
+        """Replaces the alias tables and drops derived lookup structures"""
+        self.ip_aliases = ip_aliases
+        self.port_aliases = port_aliases
+        self._network_ranges = None
+        self._port_ranges = None
         
     def parse_interfaces_from_xml(self, xml_file_path: str) -> Dict[str, str]:
         """
@@ -31,9 +81,8 @@ class OPNsenseConfigParser:
         interface_mapping = {}
         
         try:
-            tree = ET.parse(xml_file_path)
-            root = tree.getroot()
-            
+            root = _parse_xml_root(xml_file_path)
+
             # Look for interfaces section
             interfaces_section = root.find('interfaces')
             if interfaces_section is None:
@@ -43,6 +92,8 @@ class OPNsenseConfigParser:
             # Go through each defined interface
             for interface_elem in interfaces_section:
                 interface_name = interface_elem.tag  # ex: 'lan', 'wan', 'opt1'
+                if not isinstance(interface_name, str):
+                    continue  # lxml yields comments/PIs as children too
                 
                 # Get the physical interface
                 if_elem = interface_elem.find('if')
@@ -58,7 +109,7 @@ class OPNsenseConfigParser:
                     
                     interface_mapping[physical_if] = display_name
                     
-        except ET.ParseError as e:
+        except _XML_PARSE_ERRORS as e:
             print(f"XML parsing error: {e}")
         except FileNotFoundError:
             print(f"XML file not found: {xml_file_path}")
@@ -81,11 +132,14 @@ class OPNsenseConfigParser:
         """
         ip_aliases = {}
         port_aliases = {}
-        
+        # Port ranges are collected on the parser itself (not in the
+        # returned dict); a fresh parse starts from a clean slate
+        self.port_alias_ranges = []
+        self._port_ranges = None
+
         try:
-            tree = ET.parse(xml_file_path)
-            root = tree.getroot()
-            
+            root = _parse_xml_root(xml_file_path)
+
             # Look for aliases section (real OPNsense structure)
             aliases_section = root.find('.//Firewall/Alias/aliases')
             if aliases_section is None:
@@ -95,32 +149,54 @@ class OPNsenseConfigParser:
                     print("Section 'aliases' not found in XML file")
                     return ip_aliases, port_aliases
                 
-            # Go through each alias
+            # First pass: collect enabled aliases so references to other
+            # aliases can be resolved without re-walking the XML
+            alias_definitions = {}
             for alias_elem in aliases_section.findall('alias'):
                 # Check if alias is enabled
                 enabled_elem = alias_elem.find('enabled')
                 if enabled_elem is not None and enabled_elem.text != '1':
                     continue  # Skip disabled aliases
-                
+
                 alias_name = self._get_alias_name(alias_elem)
                 alias_type = self._get_alias_type(alias_elem)
                 alias_content = self._get_alias_content(alias_elem)
-                
+
                 if not alias_name or not alias_content:
                     continue
-                
+
+                alias_definitions[alias_name] = (alias_type, alias_content)
+
+            # Second pass: expand references inline and process each
+            # alias exactly once
+            for alias_name, (alias_type, alias_content) in alias_definitions.items():
+                resolved = []
+                for item in _ALIAS_SPLIT_RE.split(alias_content):
+                    if not item:
+                        continue
+                    if item != alias_name and item in alias_definitions:
+                        # Reference to another alias: inline its content
+                        ref_content = alias_definitions[item][1]
+                        resolved.extend(
+                            ref_item for ref_item in _ALIAS_SPLIT_RE.split(ref_content)
+                            if ref_item
+                        )
+                    else:
+                        resolved.append(item)
+
+                if not resolved:
+                    continue
+                resolved_content = '\n'.join(resolved)
+
                 # Classify by type
                 if alias_type in ['host', 'network', 'urltable', 'geoip']:
                     # IP/Network alias (including geoip)
-                    self._process_ip_alias(alias_name, alias_content, ip_aliases)
+                    self._process_ip_alias(alias_name, resolved_content, ip_aliases)
                 elif alias_type == 'port':
                     # Port alias
-                    self._process_port_alias(alias_name, alias_content, port_aliases)
-            
-            # Resolve alias references (aliases that reference other aliases)
-            self._resolve_alias_references(aliases_section, ip_aliases, port_aliases)
-                    
-        except ET.ParseError as e:
+                    self._process_port_alias(alias_name, resolved_content, port_aliases)
+
+        except _XML_PARSE_ERRORS as e:
             print(f"XML aliases parsing error: {e}")
         except FileNotFoundError:
             print(f"XML file not found: {xml_file_path}")
@@ -148,35 +224,22 @@ class OPNsenseConfigParser:
     def _process_ip_alias(self, alias_name: str, content: str, ip_aliases: dict):
         """Process IP/Network alias content"""
         # Content can contain multiple IPs/networks separated by newlines or commas
-        items = content.replace('\n', ',').split(',')
-        
-        for item in items:
-            item = item.strip()
+        for item in _ALIAS_SPLIT_RE.split(content):
             if item:
-                # Clean the item (remove spaces, etc.)
-                clean_item = item.strip()
-                if clean_item:
-                    ip_aliases[clean_item] = alias_name
+                ip_aliases[item] = alias_name
     
     def _process_port_alias(self, alias_name: str, content: str, port_aliases: dict):
         """Process Port alias content"""
         # Content can contain multiple ports separated by newlines or commas
-        items = content.replace('\n', ',').split(',')
-        
-        for item in items:
-            item = item.strip()
+        for item in _ALIAS_SPLIT_RE.split(content):
             if item:
                 # Support for ranges (ex: "8080:8090")
                 if ':' in item and '-' not in item:
                     # Range format port:port
                     try:
                         start_port, end_port = item.split(':')
-                        start_port = int(start_port.strip())
-                        end_port = int(end_port.strip())
-                        
-                        # Add each port in the range
-                        for port in range(start_port, end_port + 1):
-                            port_aliases[str(port)] = alias_name
+                        self._add_port_range(int(start_port.strip()),
+                                             int(end_port.strip()), alias_name)
                     except ValueError:
                         # If conversion fails, treat as simple port
                         port_aliases[item] = alias_name
@@ -184,91 +247,130 @@ class OPNsenseConfigParser:
                     # Range format port-port
                     try:
                         start_port, end_port = item.split('-')
-                        start_port = int(start_port.strip())
-                        end_port = int(end_port.strip())
-                        
-                        # Add each port in the range
-                        for port in range(start_port, end_port + 1):
-                            port_aliases[str(port)] = alias_name
+                        self._add_port_range(int(start_port.strip()),
+                                             int(end_port.strip()), alias_name)
                     except ValueError:
                         # If conversion fails, treat as simple port
                         port_aliases[item] = alias_name
                 else:
                     # Simple port
                     port_aliases[item] = alias_name
+
+    def _add_port_range(self, start_port: int, end_port: int, alias_name: str):
+        """Records a port range as an interval instead of expanding it
+
+        A range like 1024:65535 used to write every port as its own dict
+        key; stored as one (start, end, alias) tuple, lookups bisect
+        over the handful of ranges a config actually defines.
+        """
+        self.port_alias_ranges.append((start_port, end_port, alias_name))
+        self._port_ranges = None
     
     def get_ip_alias(self, ip_or_network: str) -> Optional[str]:
         """Returns the alias of an IP or network"""
         return self.ip_aliases.get(ip_or_network)
     
     def get_port_alias(self, port: str) -> Optional[str]:
-        """Returns the alias of a port"""
-        return self.port_aliases.get(port)
-    
-    def _resolve_alias_references(self, aliases_section, ip_aliases: dict, port_aliases: dict):
-        """Resolves alias references (aliases that reference other aliases)"""
-        # Create a mapping alias_name -> resolved_content
-        alias_definitions = {}
-        
-        # First pass: collect all aliases with their content
-        for alias_elem in aliases_section.findall('alias'):
-            enabled_elem = alias_elem.find('enabled')
-            if enabled_elem is not None and enabled_elem.text != '1':
-                continue
-                
-            alias_name = self._get_alias_name(alias_elem)
-            alias_content = self._get_alias_content(alias_elem)
-            alias_type = self._get_alias_type(alias_elem)
-            
-            if alias_name and alias_content:
-                alias_definitions[alias_name] = {
-                    'content': alias_content,
-                    'type': alias_type
-                }
-        
-        # Second pass: resolve references
-        for alias_elem in aliases_section.findall('alias'):
-            enabled_elem = alias_elem.find('enabled')
-            if enabled_elem is not None and enabled_elem.text != '1':
+        """Returns the alias of a port, checking ranges after exact matches"""
+        alias = self.port_aliases.get(port)
+        if alias is not None:
+            return alias
+        if not self.port_alias_ranges:
+            return None
+
+        try:
+            port_num = int(port)
+        except (TypeError, ValueError):
+            return None
+
+        ranges = self._port_ranges
+        if ranges is None:
+            ranges = self._port_ranges = self._build_port_ranges()
+
+        starts, ends, max_ends, aliases = ranges
+        idx = bisect_right(starts, port_num) - 1
+        while idx >= 0 and max_ends[idx] >= port_num:
+            if ends[idx] >= port_num:
+                return aliases[idx]
+            idx -= 1
+
+        return None
+
+    def get_network_alias(self, ip: str) -> Optional[str]:
+        """Returns the alias of the CIDR network containing an IP, if any
+
+        Lookup is one address-to-int conversion plus a bisect over
+        interval arrays built once per alias load, instead of parsing
+        every configured network per call.
+        """
+        ranges = self._network_ranges
+        if ranges is None:
+            ranges = self._network_ranges = self._build_network_ranges()
+
+        starts, ends, max_ends, aliases = ranges
+        if not starts:
+            return None
+
+        try:
+            addr = ipaddress.ip_address(ip)
+        except ValueError:
+            return None
+        key = (addr.version, int(addr))
+
+        # Rightmost interval starting at or before the address; walk
+        # left while some earlier interval could still cover it
+        idx = bisect_right(starts, key) - 1
+        while idx >= 0 and max_ends[idx] >= key:
+            if ends[idx] >= key and starts[idx][0] == key[0]:
+                return aliases[idx]
+            idx -= 1
+
+        return None
+
+    def _build_network_ranges(self):
+        """Builds sorted (family, int) interval arrays over CIDR aliases"""
+        intervals = []
+        for network, alias_name in self.ip_aliases.items():
+            if '/' not in network:
                 continue
-                
-            alias_name = self._get_alias_name(alias_elem)
-            alias_content = self._get_alias_content(alias_elem)
-            alias_type = self._get_alias_type(alias_elem)
-            
-            if not alias_name or not alias_content:
+            try:
+                net = ipaddress.ip_network(network, strict=False)
+            except ValueError:
                 continue
-            
-            # Check if content contains references to other aliases
-            lines = alias_content.replace('\n', ',').split(',')
-            resolved_content = []
-            
-            for line in lines:
-                line = line.strip()
-                if line:
-                    # Check if it's a reference to another alias
-                    if line in alias_definitions and line != alias_name:
-                        # It's a reference to another alias
-                        referenced_alias = alias_definitions[line]
-                        referenced_content = referenced_alias['content']
-                        
-                        # Add the referenced alias content
-                        ref_lines = referenced_content.replace('\n', ',').split(',')
-                        for ref_line in ref_lines:
-                            ref_line = ref_line.strip()
-                            if ref_line:
-                                resolved_content.append(ref_line)
-                    else:
-                        # Normal content
-                        resolved_content.append(line)
-            
-            # If we have resolved content, process it
-            if resolved_content:
-                resolved_content_str = '\n'.join(resolved_content)
-                
-                # Reprocess with resolved content
-                if alias_type in ['host', 'network', 'urltable', 'geoip']:
-                    self._process_ip_alias(alias_name, resolved_content_str, ip_aliases)
-                elif alias_type == 'port':
-                    self._process_port_alias(alias_name, resolved_content_str, port_aliases)
-    
\ No newline at end of file
+            intervals.append((
+                (net.version, int(net.network_address)),
+                (net.version, int(net.broadcast_address)),
+                alias_name,
+            ))
+
+        intervals.sort()
+        starts = [iv[0] for iv in intervals]
+        ends = [iv[1] for iv in intervals]
+        aliases = [iv[2] for iv in intervals]
+
+        # Running maximum of interval ends, so lookups know when no
+        # earlier (overlapping) interval can still contain the address
+        max_ends = []
+        current = None
+        for end in ends:
+            if current is None or end > current:
+                current = end
+            max_ends.append(current)
+
+        return starts, ends, max_ends, aliases
+
+    def _build_port_ranges(self):
+        """Builds sorted interval arrays over the recorded port ranges"""
+        intervals = sorted(self.port_alias_ranges)
+        starts = [iv[0] for iv in intervals]
+        ends = [iv[1] for iv in intervals]
+        aliases = [iv[2] for iv in intervals]
+
+        max_ends = []
+        current = None
+        for end in ends:
+            if current is None or end > current:
+                current = end
+            max_ends.append(current)
+
+        return starts, ends, max_ends, aliases
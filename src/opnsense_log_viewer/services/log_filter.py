@@ -3,78 +3,313 @@ Improved filtering system for OPNsense logs
 Enhanced support for interface display names and better filter management
 """
 import re
-from typing import List, Dict, Any, Callable, Optional
+import sys
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional
 from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from opnsense_log_viewer.services import ip_filter
 from opnsense_log_viewer.services.log_parser import LogEntry
 
+
+class LogEntryTable:
+    """Columnar (struct-of-arrays) view of a list of log entries
+
+    Materializes each requested field as a pandas Series so filter
+    conditions can be evaluated as vectorized boolean masks instead of
+    per-row Python comparisons.
+    """
+
+    def __init__(self, entries: List[LogEntry]):
+        self.entries = entries
+        self._columns = {}
+        self._timestamps = None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def column(self, field: str) -> pd.Series:
+        """Return the column for a field, building it lazily"""
+        column = self._columns.get(field)
+        if column is None:
+            column = pd.Series(
+                [str(entry.get(field, '')) for entry in self.entries],
+                dtype=object
+            )
+            self._columns[field] = column
+        return column
+
+    @property
+    def timestamps(self) -> pd.Series:
+        """Return entry timestamps as a datetime64 column (NaT if missing)"""
+        if self._timestamps is None:
+            self._timestamps = pd.Series(
+                pd.to_datetime([entry.timestamp for entry in self.entries])
+            )
+        return self._timestamps
+
 class FilterCondition:
     """Represents a filtering condition"""
     
     def __init__(self, field: str, operator: str, value: str, case_sensitive: bool = False):
-        self.field = field
+        # Intern the field name so per-entry dict lookups compare by pointer;
+        # parsed_data keys are compile-time literals and already interned
+        self.field = sys.intern(field)
         self.operator = operator  # '==', '!=', 'contains', 'startswith', 'endswith', 'regex', '>', '<', '>=', '<='
         self.value = value
         self.case_sensitive = case_sensitive
-        
+
+        # Precompile the regex once instead of on every evaluated entry.
+        # Patterns without metacharacters degrade to a plain substring
+        # search, skipping the regex engine entirely.
+        self._regex = None
+        self._regex_literal = False
+        if operator == 'regex':
+            if re.escape(value) == value:
+                self._regex_literal = True
+            else:
+                try:
+                    self._regex = re.compile(value, re.IGNORECASE if not case_sensitive else 0)
+                except re.error:
+                    # Invalid pattern: evaluation will simply never match
+                    self._regex = None
+        # Precompute the case-folded comparison value used by string operators
+        self._comparison_value = value if case_sensitive else value.lower()
+        # Bind the operator to a specialized callable once instead of
+        # walking an if/elif ladder for every evaluated entry
+        self._match_fn = self._build_match_fn()
+
+    def __getstate__(self):
+        # The compiled regex and bound closures do not pickle; ship the
+        # defining parameters and rebuild on the other side
+        return {
+            'field': self.field,
+            'operator': self.operator,
+            'value': self.value,
+            'case_sensitive': self.case_sensitive,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(
+            state['field'], state['operator'], state['value'], state['case_sensitive']
+        )
+
     def evaluate(self, entry: LogEntry) -> bool:
         """Evaluate the condition on a log entry"""
+        # Read parsed_data directly: skips the LogEntry.get wrapper frame,
+        # which adds up over millions of evaluated rows
+        parsed_data = entry.parsed_data
+
         # Handle special interface field mapping
         if self.field == 'interface':
             # Check both physical and logical interface names
-            field_value = entry.get('interface', '')
-            interface_display = entry.get('interface_display', '')
-            
+            field_value = parsed_data.get('interface', '')
+            interface_display = parsed_data.get('interface_display', '')
+
             # Check if the value matches either physical or display name
             if self._check_value_match(field_value) or self._check_value_match(interface_display):
                 return True
             return False
         else:
-            field_value = entry.get(self.field, '')
+            field_value = parsed_data.get(self.field, '')
             return self._check_value_match(field_value)
     
+    def _build_match_fn(self) -> Callable[[Any], bool]:
+        """Build the specialized matching callable for this condition"""
+        value = self.value
+        folded_value = self._comparison_value
+
+        def fold(field_value: Any) -> tuple:
+            # Case-insensitive string comparisons fold both sides;
+            # non-string values keep the original comparison value
+            if isinstance(field_value, str):
+                return field_value.lower(), folded_value
+            return field_value, value
+
+        if self.case_sensitive:
+            fold = lambda field_value: (field_value, value)
+
+        if self.operator == '==':
+            def match(fv):
+                f, c = fold(fv)
+                return str(f) == c
+            return match
+        elif self.operator == '!=':
+            def match(fv):
+                f, c = fold(fv)
+                return str(f) != c
+            return match
+        elif self.operator == 'contains':
+            def match(fv):
+                f, c = fold(fv)
+                return c in str(f)
+            return match
+        elif self.operator == 'startswith':
+            def match(fv):
+                f, c = fold(fv)
+                return str(f).startswith(c)
+            return match
+        elif self.operator == 'endswith':
+            def match(fv):
+                f, c = fold(fv)
+                return str(f).endswith(c)
+            return match
+        elif self.operator == 'regex':
+            if self._regex_literal:
+                def match(fv):
+                    f, c = fold(fv)
+                    return c in str(f)
+                return match
+            if self._regex is None:
+                return lambda fv: False
+            search = self._regex.search
+            return lambda fv: search(str(fv)) is not None
+        elif self.operator in ('>', '<', '>=', '<='):
+            try:
+                num_value = float(value)
+            except (ValueError, TypeError):
+                return lambda fv: False
+            compare_func = {
+                '>': lambda x, y: x > y,
+                '<': lambda x, y: x < y,
+                '>=': lambda x, y: x >= y,
+                '<=': lambda x, y: x <= y,
+            }[self.operator]
+
+            def numeric_match(fv):
+                try:
+                    return compare_func(float(fv), num_value)
+                except (ValueError, TypeError):
+                    return False
+            return numeric_match
+
+        # Unknown operator never matches
+        return lambda fv: False
+
     def _check_value_match(self, field_value: Any) -> bool:
         """Check if field value matches the condition"""
-        if not self.case_sensitive and isinstance(field_value, str):
-            field_value = field_value.lower()
-            comparison_value = self.value.lower()
-        else:
-            comparison_value = self.value
-            
         try:
+            return self._match_fn(field_value)
+        except Exception:
+            return False
+
+    def evaluate_mask(self, table: 'LogEntryTable') -> np.ndarray:
+        """Evaluate the condition on a whole table as a boolean mask"""
+        if self.field == 'interface':
+            # Check both physical and logical interface names
+            return (self._column_mask(table.column('interface')) |
+                    self._column_mask(table.column('interface_display')))
+        return self._column_mask(table.column(self.field))
+
+    def _column_mask(self, column: pd.Series) -> np.ndarray:
+        """Vectorized equivalent of _check_value_match for one column"""
+        try:
+            if not self.case_sensitive:
+                column = column.str.lower()
+            comparison_value = self._comparison_value
+
             if self.operator == '==':
-                return str(field_value) == comparison_value
+                mask = column == comparison_value
             elif self.operator == '!=':
-                return str(field_value) != comparison_value
+                mask = column != comparison_value
             elif self.operator == 'contains':
-                return comparison_value in str(field_value)
+                mask = column.str.contains(comparison_value, regex=False)
             elif self.operator == 'startswith':
-                return str(field_value).startswith(comparison_value)
+                mask = column.str.startswith(comparison_value)
             elif self.operator == 'endswith':
-                return str(field_value).endswith(comparison_value)
+                mask = column.str.endswith(comparison_value)
             elif self.operator == 'regex':
-                pattern = re.compile(self.value, re.IGNORECASE if not self.case_sensitive else 0)
-                return bool(pattern.search(str(field_value)))
-            elif self.operator == '>':
-                return self._numeric_compare(field_value, comparison_value, lambda x, y: x > y)
-            elif self.operator == '<':
-                return self._numeric_compare(field_value, comparison_value, lambda x, y: x < y)
-            elif self.operator == '>=':
-                return self._numeric_compare(field_value, comparison_value, lambda x, y: x >= y)
-            elif self.operator == '<=':
-                return self._numeric_compare(field_value, comparison_value, lambda x, y: x <= y)
+                if self._regex_literal:
+                    mask = column.str.contains(comparison_value, regex=False)
+                elif self._regex is None:
+                    return np.zeros(len(column), dtype=bool)
+                else:
+                    mask = column.str.contains(self._regex)
+            elif self.operator in ('>', '<', '>=', '<='):
+                try:
+                    num_value = float(self.value)
+                except (ValueError, TypeError):
+                    return np.zeros(len(column), dtype=bool)
+                numeric = pd.to_numeric(column, errors='coerce')
+                if self.operator == '>':
+                    mask = numeric > num_value
+                elif self.operator == '<':
+                    mask = numeric < num_value
+                elif self.operator == '>=':
+                    mask = numeric >= num_value
+                else:
+                    mask = numeric <= num_value
+            else:
+                return np.zeros(len(column), dtype=bool)
+
+            return mask.fillna(False).to_numpy(dtype=bool)
         except Exception:
-            return False
-            
-        return False
-    
-    def _numeric_compare(self, field_value: Any, comparison_value: str, compare_func: Callable) -> bool:
-        """Numeric comparison with error handling"""
+            return np.zeros(len(column), dtype=bool)
+
+def columns_condition_mask(condition: FilterCondition, cols) -> Optional[np.ndarray]:
+    """Integer-column mask for a condition over a LogColumns block
+
+    Uses the enum/packed-IPv4 encodings when the condition has one:
+    action and protoname equality become uint8 compares, src/dst become
+    uint32 equality or a CIDR AND+compare, ports become integer
+    compares. Returns None when the condition has no columnar encoding
+    so the caller falls back to the string-based path.
+    """
+    # Local import: virtual_log_manager sits above this module in the
+    # service stack
+    from opnsense_log_viewer.services import virtual_log_manager as vlm
+
+    operator = condition.operator
+    value = condition.value
+
+    if condition.case_sensitive and condition.field in ('action', 'protoname'):
+        # The enum lookup is case-insensitive by construction
+        return None
+
+    if condition.field == 'action' and operator in ('==', '!='):
+        code = vlm.ACTION_CODES.get(value.lower())
+        if code is None:
+            return None
+        mask = cols.action == code
+        return mask if operator == '==' else ~mask
+
+    if condition.field == 'protoname' and operator in ('==', '!='):
+        code = vlm.PROTO_CODES.get(value.lower())
+        if code is None:
+            return None
+        mask = cols.proto == code
+        return mask if operator == '==' else ~mask
+
+    if condition.field in ('src', 'dst'):
+        column = cols.src if condition.field == 'src' else cols.dst
+        # CIDR literals and whole-octet prefixes run through the packed
+        # address kernel
+        network = ip_filter.condition_network(value, operator)
+        if network is not None:
+            return ip_filter.cidr_mask(column, network)
+        if operator in ('==', '!='):
+            packed = vlm.pack_ipv4(value)
+            if packed == 0:
+                return None
+            mask = column == np.uint32(packed)
+            return mask if operator == '==' else ~mask
+        return None
+
+    if condition.field in ('srcport', 'dstport') and operator in ('==', '!='):
         try:
-            num_field = float(field_value)
-            num_comparison = float(comparison_value)
-            return compare_func(num_field, num_comparison)
-        except (ValueError, TypeError):
-            return False
+            port = int(value)
+        except ValueError:
+            return None
+        if port == 0:
+            # Missing ports are stored as 0, so 0 is ambiguous
+            return None
+        column = cols.srcport if condition.field == 'srcport' else cols.dstport
+        mask = column == np.uint32(port)
+        return mask if operator == '==' else ~mask
+
+    return None
 
 class FilterExpression:
     """Represents a complex filtering expression with AND, OR, NOT"""
@@ -104,18 +339,115 @@ class FilterExpression:
             
         # Evaluate subsequent conditions with operators
         for i in range(1, len(self.conditions)):
+            operator = self.operators[i-1]
+
+            # Short-circuit: False AND x and True OR x are already decided,
+            # so skip evaluating the condition entirely
+            if operator == 'AND' and not result:
+                continue
+            if operator == 'OR' and result:
+                continue
+
             condition_result = self.conditions[i].evaluate(entry)
             if self.negations[i]:
                 condition_result = not condition_result
-                
+
+            if operator == 'AND':
+                result = condition_result
+            elif operator == 'OR':
+                result = condition_result
+
+        return result
+
+    # Relative evaluation cost per operator, used to order AND chains
+    _OPERATOR_COST = {
+        '==': 0, '!=': 1, 'startswith': 1, 'endswith': 1,
+        '>': 1, '<': 1, '>=': 1, '<=': 1,
+        'contains': 2, 'regex': 3,
+    }
+
+    def optimize(self):
+        """Reorder AND-only chains so cheaper conditions evaluate first
+
+        Classic selectivity trick: equality checks reject most rows at a
+        fraction of the cost of contains/regex, so run them first to let
+        short-circuiting skip the expensive conditions. Mixed AND/OR
+        expressions are left untouched to preserve evaluation order.
+        """
+        if len(self.conditions) < 2 or any(op != 'AND' for op in self.operators):
+            return
+
+        order = sorted(
+            range(len(self.conditions)),
+            key=lambda i: self._OPERATOR_COST.get(self.conditions[i].operator, 2)
+        )
+        self.conditions = [self.conditions[i] for i in order]
+        self.negations = [self.negations[i] for i in order]
+
+    def _combined_regex_mask(self, table: 'LogEntryTable') -> Optional[np.ndarray]:
+        """Single-pass alternation for OR-only regex chains on one field
+
+        Several OR-joined regex conditions on the same field compile into
+        one '(?:a)|(?:b)' pattern scanned once per row, instead of one
+        full column pass per pattern. Returns None when the expression
+        has any other shape.
+        """
+        conditions = self.conditions
+        if len(conditions) < 2 or any(self.negations):
+            return None
+        if any(op != 'OR' for op in self.operators):
+            return None
+
+        first = conditions[0]
+        if first.field == 'interface':
+            # Interface checks span two columns; not worth special-casing
+            return None
+        for condition in conditions:
+            if (condition.field != first.field or condition.operator != 'regex'
+                    or condition.case_sensitive != first.case_sensitive
+                    or condition._regex is None):
+                return None
+
+        flags = 0 if first.case_sensitive else re.IGNORECASE
+        try:
+            pattern = re.compile('|'.join(f'(?:{c.value})' for c in conditions), flags)
+        except re.error:
+            return None
+
+        column = table.column(first.field)
+        return column.str.contains(pattern).fillna(False).to_numpy(dtype=bool)
+
+    def evaluate_mask(self, table: 'LogEntryTable') -> np.ndarray:
+        """Evaluate the complete expression on a table as a boolean mask"""
+        if not self.conditions:
+            return np.ones(len(table), dtype=bool)
+
+        combined = self._combined_regex_mask(table)
+        if combined is not None:
+            return combined
+
+        # Masks are fused in place: each combine step writes into the
+        # accumulator instead of allocating another N-row array
+        result = self.conditions[0].evaluate_mask(table)
+        if self.negations[0]:
+            result = ~result
+        elif not result.flags.writeable:
+            # to_numpy() may hand back a read-only view
+            result = result.copy()
+
+        for i in range(1, len(self.conditions)):
+            condition_mask = self.conditions[i].evaluate_mask(table)
+            if self.negations[i]:
+                condition_mask = ~condition_mask
+
             operator = self.operators[i-1]
             if operator == 'AND':
-                result = result and condition_result
+                np.logical_and(result, condition_mask, out=result)
             elif operator == 'OR':
-                result = result or condition_result
-                
+                np.logical_or(result, condition_mask, out=result)
+
         return result
-    
+
     def clear(self):
         """Clear the expression"""
         self.conditions = []
@@ -148,22 +480,106 @@ class LogFilter:
         self.time_range_start = None
         self.time_range_end = None
         
-    def filter_entries(self, entries: List[LogEntry]) -> List[LogEntry]:
-        """Apply all filters to a list of entries"""
-        filtered_entries = []
-        
-        for entry in entries:
-            # Check time range
-            if self.time_range_start and entry.timestamp < self.time_range_start:
+    def filter_entries(self, entries: List[LogEntry], index=None) -> List[LogEntry]:
+        """Apply all filters to a list of entries (vectorized)
+
+        When an NGramIndex built over the same entries is supplied,
+        AND-only expressions are narrowed to the index candidate set
+        before verification.
+        """
+        if not entries:
+            return []
+
+        if index is not None and index.size == len(entries):
+            candidate_rows = self._index_candidates(index)
+            if candidate_rows is not None:
+                subset = [entries[i] for i in sorted(candidate_rows)]
+                return self.filter_entries(subset)
+
+        table = LogEntryTable(entries)
+        mask = self.expression.evaluate_mask(table)
+
+        # Time range as vector compares on the datetime64 column
+        if self.time_range_start:
+            mask = mask & (table.timestamps >= self.time_range_start).to_numpy()
+        if self.time_range_end:
+            mask = mask & (table.timestamps <= self.time_range_end).to_numpy()
+
+        return [entry for entry, keep in zip(entries, mask) if keep]
+
+    def filter_entries_batched(self, batches: Iterable[List[LogEntry]]) -> Iterator[np.ndarray]:
+        """Yield one boolean mask per batch of entries
+
+        Streaming counterpart of filter_entries: peak memory stays O(batch)
+        instead of O(total rows), so callers can page through huge logs
+        without materializing the full filtered list.
+        """
+        for batch in batches:
+            if not batch:
+                yield np.zeros(0, dtype=bool)
                 continue
-            if self.time_range_end and entry.timestamp > self.time_range_end:
+
+            table = LogEntryTable(batch)
+            mask = self.expression.evaluate_mask(table)
+
+            if self.time_range_start:
+                mask = mask & (table.timestamps >= self.time_range_start).to_numpy()
+            if self.time_range_end:
+                mask = mask & (table.timestamps <= self.time_range_end).to_numpy()
+
+            yield mask
+
+    def apply_vectorized(self, cols) -> Optional[np.ndarray]:
+        """Evaluates the expression as NumPy masks over a LogColumns block
+
+        Fast path for preset-style filters whose conditions all map to
+        the integer columns (action/proto enums, packed IPv4, ports).
+        Returns None when any condition needs the string-based path.
+        """
+        expression = self.expression
+        if not expression.conditions:
+            return np.ones(len(cols), dtype=bool)
+
+        mask = None
+        for i, condition in enumerate(expression.conditions):
+            condition_mask = columns_condition_mask(condition, cols)
+            if condition_mask is None:
+                return None
+            if expression.negations[i]:
+                condition_mask = ~condition_mask
+
+            if mask is None:
+                mask = condition_mask
+                if not mask.flags.writeable:
+                    mask = mask.copy()
+            elif expression.operators[i-1] == 'AND':
+                np.logical_and(mask, condition_mask, out=mask)
+            else:
+                np.logical_or(mask, condition_mask, out=mask)
+
+        return mask
+
+    def _index_candidates(self, index):
+        """Candidate row set from the n-gram index, or None if unusable
+
+        Only valid for AND-only expressions: a negated or OR-joined
+        condition can match rows outside any single candidate set.
+        """
+        expression = self.expression
+        if not expression.conditions:
+            return None
+        if any(op != 'AND' for op in expression.operators):
+            return None
+
+        candidate_rows = None
+        for condition, negated in zip(expression.conditions, expression.negations):
+            if negated:
                 continue
-                
-            # Check filter expression
-            if self.expression.evaluate(entry):
-                filtered_entries.append(entry)
-                
-        return filtered_entries
+            rows = index.candidates(condition)
+            if rows is not None:
+                candidate_rows = rows if candidate_rows is None else candidate_rows & rows
+
+        return candidate_rows
         
     def get_filter_summary(self) -> str:
         """Return text summary of active filters"""
@@ -3,6 +3,7 @@ OPNsense Log Parser with comprehensive error handling
 """
 import re
 import hashlib
+import mmap
 import os
 from datetime import datetime
 from typing import Dict, List, Optional, Any
@@ -12,31 +13,123 @@ from opnsense_log_viewer.utils.logging_config import get_logger, log_exception
 
 logger = get_logger(__name__)
 
+# Small-integer encodings for the hot fields, assigned once at parse
+# time so filters compare uint8 codes instead of strings
+ACTION_OTHER = 0
+ACTION_PASS = 1
+ACTION_BLOCK = 2
+ACTION_RDR = 3
+ACTION_CODES = {'pass': ACTION_PASS, 'block': ACTION_BLOCK, 'rdr': ACTION_RDR}
+
+PROTO_OTHER = 0
+PROTO_TCP = 1
+PROTO_UDP = 2
+PROTO_ICMP = 3
+PROTO_CODES = {'tcp': PROTO_TCP, 'udp': PROTO_UDP, 'icmp': PROTO_ICMP, 'ipv6-icmp': PROTO_ICMP}
+
+
+def _parse_file_chunk(args):
+    """Parse one newline-aligned byte chunk of a log file
+    (module-level function for multiprocessing compatibility)
+    """
+    filepath, start_offset, end_offset, interface_mapping = args
+
+    local_parser = OPNsenseLogParser()
+    if interface_mapping:
+        local_parser.set_interface_mapping(interface_mapping)
+
+    entries = []
+    with open(filepath, 'rb') as f:
+        if start_offset:
+            # Back up one byte then consume to the next newline: the
+            # previous chunk owns any partial line, but a line starting
+            # exactly on the boundary must not be skipped
+            f.seek(start_offset - 1)
+            f.readline()
+        else:
+            f.seek(0)
+
+        while f.tell() < end_offset:
+            raw_line = f.readline()
+            if not raw_line:
+                break
+            if b'filterlog' not in raw_line:
+                continue
+            # latin-1 is a straight byte-to-codepoint copy with no
+            # validation; filterlog lines are ASCII so it decodes the
+            # same as UTF-8 at a fraction of the cost
+            entry = local_parser.parse_log_line(raw_line.decode('latin-1').strip())
+            if entry:
+                entries.append(entry)
+
+    return entries
+
 
 class LogEntry:
     """Log entry class"""
+    # Slots avoid a per-instance __dict__; raw_line stays because the
+    # details tab and label-hash fallback render the original line
+    __slots__ = ('raw_line', 'parsed_data', 'timestamp', 'host', '_digest')
+
     def __init__(self, raw_line: str):
         self.raw_line = raw_line
         self.parsed_data = {}
         self.timestamp = None
         self.host = None
-        self.digest = None
+        self._digest = None
+
+    @property
+    def digest(self):
+        """MD5 digest of the raw line, computed on first access"""
+        if self._digest is None:
+            try:
+                self._digest = hashlib.md5(self.raw_line.encode()).hexdigest()
+            except Exception:
+                self._digest = ''
+        return self._digest
 
     def __getitem__(self, key):
+        if key == '__digest__':
+            return self.digest
         return self.parsed_data.get(key, '')
 
     def __contains__(self, key):
         return key in self.parsed_data
 
     def get(self, key, default=''):
+        if key == '__digest__':
+            return self.digest
         return self.parsed_data.get(key, default)
 
 
 class OPNsenseLogParser:
     """OPNsense log parser with comprehensive error handling"""
 
+    # Single-pass line matcher: timestamp, optional host tokens, the
+    # filterlog token, then the CSV payload
+    _line_re = re.compile(r'^(\S+)\s+(?:\S+\s+)*?\S*filterlog\S*\s+(.+)$')
+
+    # Maximum number of distinct CSV payloads kept in the template cache
+    _TEMPLATE_CACHE_MAX = 65536
+
+    # Maximum number of distinct timestamp strings kept memoized; bursts
+    # produce hundreds of lines sharing the same second
+    _TS_CACHE_MAX = 4096
+
+    # Month abbreviations for the syslog timestamp format
+    _MONTH_NUM = {
+        'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+        'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+    }
+
     def __init__(self):
         self.interface_mapping = {}
+        # Firewall logs repeat the same payload thousands of times; cache
+        # the parsed rule per CSV tail and clone it instead of re-parsing
+        self._template_cache = {}
+        # Parsed datetime per raw timestamp string; lines logged within
+        # the same second share one conversion
+        self._ts_cache = {}
         logger.debug("OPNsenseLogParser initialized")
 
     def set_interface_mapping(self, mapping: Dict[str, str]):
@@ -45,6 +138,8 @@ class OPNsenseLogParser:
             if not isinstance(mapping, dict):
                 raise TypeError("Interface mapping must be a dictionary")
             self.interface_mapping = mapping
+            # Cached templates embed interface_display, so they are stale now
+            self._template_cache.clear()
             logger.info(f"Interface mapping set: {len(mapping)} interfaces configured")
         except Exception as e:
             log_exception(logger, e, "Failed to set interface mapping")
@@ -56,103 +151,133 @@ class OPNsenseLogParser:
             if not line or 'filterlog' not in line:
                 return None
 
-            entry = LogEntry(line)
-            parts = line.split()
-            if len(parts) < 4:
-                return None
+            # Fast path: locate the payload with three find() calls
+            # instead of running the prefix regex. Valid when the line is
+            # '<timestamp> ... filterlog[...]: <payload>' with the colon
+            # inside the filterlog token.
+            timestamp_str = data_part = None
+            token = line.find('filterlog')
+            space = line.find(' ')
+            if 0 < space < token:
+                sep = line.find(': ', token)
+                if sep != -1 and ' ' not in line[token:sep]:
+                    timestamp_str = line[:space]
+                    data_part = line[sep + 2:]
+
+            if data_part is None:
+                match = self._line_re.match(line)
+                if match is None:
+                    return None
+                timestamp_str = match.group(1)
+                data_part = match.group(2)
 
-            timestamp_str = parts[0]
+            entry = LogEntry(line)
             host = 'opnsense'
+            template = self._template_cache.get(data_part)
+            if template is not None:
+                rule = template.copy()
+            else:
+                # CSV payload is whitespace-free; split without per-field
+                # strip, and stop tokenizing after the 28 consumed fields
+                # so trailing payload is never materialized field by field
+                rule = self._parse_fields(data_part.split(',', 28))
 
-            filterlog_idx = -1
-            for i, part in enumerate(parts):
-                if 'filterlog' in part:
-                    filterlog_idx = i
-                    break
-
-            if filterlog_idx < 0 or filterlog_idx + 1 >= len(parts):
-                return None
+                if not rule or 'action' not in rule:
+                    return None
 
-            data_part = ' '.join(parts[filterlog_idx + 1:])
-            fields = [f.strip() for f in data_part.split(',')]
-            rule = self._parse_fields(fields)
+                # Single lookup with the physical name as its own fallback
+                interface = rule.get('interface', '')
+                rule['interface_display'] = self.interface_mapping.get(interface, interface)
 
-            if not rule or 'action' not in rule:
-                return None
-
-            if 'interface' in rule and rule['interface'] in self.interface_mapping:
-                rule['interface_display'] = self.interface_mapping[rule['interface']]
-            else:
-                rule['interface_display'] = rule.get('interface', '')
+                if len(self._template_cache) >= self._TEMPLATE_CACHE_MAX:
+                    self._template_cache.clear()
+                self._template_cache[data_part] = rule.copy()
 
             rule['__timestamp__'] = timestamp_str
             rule['__host__'] = host
-            try:
-                rule['__digest__'] = hashlib.md5(line.encode()).hexdigest()
-            except Exception:
-                rule['__digest__'] = ''
 
             entry.parsed_data = rule
 
-            try:
-                if 'T' in timestamp_str:
-                    entry.timestamp = datetime.fromisoformat(timestamp_str.replace('T', ' '))
-                else:
-                    entry.timestamp = datetime.strptime(timestamp_str, '%b %d %H:%M:%S')
-            except Exception:
-                entry.timestamp = datetime.now()
+            ts = self._ts_cache.get(timestamp_str)
+            if ts is None:
+                try:
+                    ts = self._parse_timestamp(timestamp_str)
+                except (ValueError, IndexError):
+                    # Not cached: a malformed stamp should not pin one
+                    # wall-clock instant for every later occurrence
+                    ts = None
+                if ts is not None:
+                    if len(self._ts_cache) >= self._TS_CACHE_MAX:
+                        self._ts_cache.clear()
+                    self._ts_cache[timestamp_str] = ts
+            entry.timestamp = ts if ts is not None else datetime.now()
 
             entry.host = host
-            entry.digest = rule['__digest__']
             return entry
 
         except Exception as e:
             logger.debug(f"Error parsing line: {e}")
             return None
 
+    @classmethod
+    def _parse_timestamp(cls, timestamp_str: str) -> datetime:
+        """Parse a log timestamp without the generic strptime machinery"""
+        # Fast path: fixed-width ISO 'YYYY-MM-DDTHH:MM:SS'
+        if len(timestamp_str) == 19 and timestamp_str[4] == '-' and timestamp_str[10] == 'T':
+            return datetime(
+                int(timestamp_str[:4]), int(timestamp_str[5:7]), int(timestamp_str[8:10]),
+                int(timestamp_str[11:13]), int(timestamp_str[14:16]), int(timestamp_str[17:19])
+            )
+
+        # Fractional seconds or offset variants: rare, use the stdlib
+        if 'T' in timestamp_str:
+            return datetime.fromisoformat(timestamp_str.replace('T', ' '))
+
+        # Syslog '%b %d %H:%M:%S' (year defaults to 1900 like strptime)
+        month = cls._MONTH_NUM.get(timestamp_str[:3])
+        if month is not None and len(timestamp_str) >= 15:
+            return datetime(
+                1900, month, int(timestamp_str[4:6]),
+                int(timestamp_str[7:9]), int(timestamp_str[10:12]), int(timestamp_str[13:15])
+            )
+
+        return datetime.strptime(timestamp_str, '%b %d %H:%M:%S')
+
     def _parse_fields(self, fields: List[str]) -> Dict[str, str]:
         """Parse fields according to OPNsense specification"""
         rule = {}
         try:
-            rule['rulenr'] = fields[0] if len(fields) > 0 else ''
-            rule['subrulenr'] = fields[1] if len(fields) > 1 else ''
-            rule['anchorname'] = fields[2] if len(fields) > 2 else ''
-            rule['rid'] = fields[3] if len(fields) > 3 else ''
-            rule['interface'] = fields[4] if len(fields) > 4 else ''
-            rule['reason'] = fields[5] if len(fields) > 5 else ''
-            rule['action'] = fields[6] if len(fields) > 6 else ''
-            rule['dir'] = fields[7] if len(fields) > 7 else ''
-            rule['ipversion'] = fields[8] if len(fields) > 8 else ''
-
-            if rule['ipversion'] == '4' and len(fields) > 9:
-                rule['tos'] = fields[9] if len(fields) > 9 else ''
-                rule['ecn'] = fields[10] if len(fields) > 10 else ''
-                rule['ttl'] = fields[11] if len(fields) > 11 else ''
-                rule['id'] = fields[12] if len(fields) > 12 else ''
-                rule['offset'] = fields[13] if len(fields) > 13 else ''
-                rule['ipflags'] = fields[14] if len(fields) > 14 else ''
-                rule['protonum'] = fields[15] if len(fields) > 15 else ''
-                rule['protoname'] = fields[16] if len(fields) > 16 else ''
-                rule['length'] = fields[17] if len(fields) > 17 else ''
-                rule['src'] = fields[18] if len(fields) > 18 else ''
-                rule['dst'] = fields[19] if len(fields) > 19 else ''
-
-                if rule['protonum'] in ['6', '17'] and len(fields) > 20:
-                    rule['srcport'] = fields[20] if len(fields) > 20 else ''
-                    rule['dstport'] = fields[21] if len(fields) > 21 else ''
-                    rule['datalen'] = fields[22] if len(fields) > 22 else ''
-
-                    if rule['protonum'] == '6' and len(fields) > 23:
-                        rule['tcpflags'] = fields[23] if len(fields) > 23 else ''
-                        rule['seq'] = fields[24] if len(fields) > 24 else ''
-                        rule['ack'] = fields[25] if len(fields) > 25 else ''
-                        rule['urp'] = fields[26] if len(fields) > 26 else ''
-                        rule['tcpopts'] = fields[27] if len(fields) > 27 else ''
+            # Pad once so each section can tuple-unpack unconditionally
+            # instead of re-checking len(fields) per field
+            n = len(fields)
+            if n < 28:
+                fields = fields + [''] * (28 - n)
+
+            (rule['rulenr'], rule['subrulenr'], rule['anchorname'], rule['rid'],
+             rule['interface'], rule['reason'], rule['action'], rule['dir'],
+             rule['ipversion']) = fields[:9]
+
+            if rule['ipversion'] == '4' and n > 9:
+                (rule['tos'], rule['ecn'], rule['ttl'], rule['id'], rule['offset'],
+                 rule['ipflags'], rule['protonum'], rule['protoname'], rule['length'],
+                 rule['src'], rule['dst']) = fields[9:20]
+
+                if rule['protonum'] in ('6', '17') and n > 20:
+                    rule['srcport'], rule['dstport'], rule['datalen'] = fields[20:23]
+
+                    if rule['protonum'] == '6' and n > 23:
+                        (rule['tcpflags'], rule['seq'], rule['ack'], rule['urp'],
+                         rule['tcpopts']) = fields[23:28]
 
             if 'protonum' in rule:
                 proto_map = {'6': 'tcp', '17': 'udp', '1': 'icmp', '112': 'carp'}
                 rule['protoname'] = proto_map.get(rule['protonum'], rule['protonum'])
 
+            # Enum codes computed once here (and template-cached), so
+            # vectorized filters never touch the strings again
+            rule['__action_code__'] = ACTION_CODES.get(rule['action'], ACTION_OTHER)
+            rule['__proto_code__'] = PROTO_CODES.get(rule.get('protoname', ''), PROTO_OTHER)
+
         except (IndexError, ValueError):
             pass
         return rule
@@ -175,17 +300,38 @@ class OPNsenseLogParser:
         logger.info(f"Parsing log file: {filepath}")
 
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                for line_num, line in enumerate(f, 1):
-                    if max_lines and lines_processed >= max_lines:
-                        break
-                    try:
-                        entry = self.parse_log_line(line.strip())
-                        if entry:
-                            entries.append(entry)
-                    except Exception as e:
-                        logger.debug(f"Error parsing line {line_num}: {e}")
-                    lines_processed += 1
+            with open(filepath, 'rb') as f:
+                if os.path.getsize(filepath) == 0:
+                    logger.info("Parsed 0 valid entries from empty file")
+                    return entries
+
+                # mmap the whole file and walk newline offsets directly:
+                # no per-line buffer management, and rejected lines are
+                # tested in place without slicing a bytes object
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    find = mm.find
+                    size = len(mm)
+                    pos = 0
+
+                    while pos < size:
+                        if max_lines and lines_processed >= max_lines:
+                            break
+
+                        newline = find(b'\n', pos)
+                        end = size if newline == -1 else newline
+
+                        if find(b'filterlog', pos, end) != -1:
+                            try:
+                                entry = self.parse_log_line(
+                                    mm[pos:end].decode('latin-1').strip()
+                                )
+                                if entry:
+                                    entries.append(entry)
+                            except Exception as e:
+                                logger.debug(f"Error parsing line {lines_processed + 1}: {e}")
+
+                        lines_processed += 1
+                        pos = end + 1
 
         except PermissionError as e:
             error_msg = f"Permission denied reading file: {filepath}"
@@ -203,6 +349,47 @@ class OPNsenseLogParser:
         logger.info(f"Parsed {len(entries)} valid entries from {lines_processed} lines")
         return entries
 
+    def parse_log_file_parallel(self, filepath: str, workers: int = None) -> List[LogEntry]:
+        """Parse a log file in parallel over newline-aligned byte chunks"""
+        if not os.path.exists(filepath):
+            error_msg = f"Log file not found: {filepath}"
+            logger.error(error_msg)
+            raise FileOperationError(error_msg, file_path=filepath, operation="read")
+
+        if not os.access(filepath, os.R_OK):
+            error_msg = f"Log file is not readable: {filepath}"
+            logger.error(error_msg)
+            raise FileOperationError(error_msg, file_path=filepath, operation="read")
+
+        workers = workers or os.cpu_count() or 1
+        file_size = os.path.getsize(filepath)
+
+        # Small files are not worth the process startup cost
+        if workers <= 1 or file_size < 1024 * 1024:
+            return self.parse_log_file(filepath)
+
+        logger.info(f"Parsing log file with {workers} workers: {filepath}")
+
+        boundaries = [file_size * i // workers for i in range(workers + 1)]
+        worker_args = [
+            (filepath, boundaries[i], boundaries[i + 1], self.interface_mapping)
+            for i in range(workers)
+        ]
+
+        entries = []
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # map() yields chunk results in offset order
+                for chunk_entries in executor.map(_parse_file_chunk, worker_args):
+                    entries.extend(chunk_entries)
+        except Exception as e:
+            log_exception(logger, e, f"Parallel parse failed, falling back to sequential: {filepath}")
+            return self.parse_log_file(filepath)
+
+        logger.info(f"Parsed {len(entries)} valid entries from {file_size} bytes")
+        return entries
+
     def parse_log_file_generator(self, filepath: str):
         """Generator to iterate through a large file line by line"""
         if not os.path.exists(filepath):
@@ -218,12 +405,15 @@ class OPNsenseLogParser:
         logger.info(f"Starting generator parse for file: {filepath}")
 
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            with open(filepath, 'rb') as f:
                 line_num = 0
-                for line in f:
+                for raw_line in f:
                     line_num += 1
+                    # Same bytes prefilter as parse_log_file
+                    if b'filterlog' not in raw_line:
+                        continue
                     try:
-                        entry = self.parse_log_line(line.strip())
+                        entry = self.parse_log_line(raw_line.decode('latin-1').strip())
                         if entry:
                             yield entry
                     except Exception as e:
@@ -0,0 +1,160 @@
+"""
+Trigram inverted index for accelerating contains/regex filters
+Maps character n-grams from selected fields to candidate row ids so that
+substring filters only verify a small candidate set instead of scanning
+every entry.
+"""
+import re
+from typing import List, Optional, Set
+
+from opnsense_log_viewer.services.log_parser import LogEntry
+
+# Characters with special meaning in regular expressions
+_REGEX_METACHARS = set('.^$*+?{}[]\\|()')
+
+
+class NGramIndex:
+    """Inverted index of character n-grams over selected entry fields"""
+
+    DEFAULT_FIELDS = ('src', 'dst', 'action', 'interface', 'interface_display')
+
+    def __init__(self, n: int = 3, fields=DEFAULT_FIELDS):
+        self.n = n
+        self.fields = fields
+        self._postings = {}  # gram -> set of row ids
+        self.size = 0
+
+    def build(self, entries: List[LogEntry]):
+        """Build the index over a list of entries"""
+        n = self.n
+        postings = {}
+
+        for row_id, entry in enumerate(entries):
+            grams = set()
+            for field in self.fields:
+                value = str(entry.get(field, '')).lower()
+                for i in range(len(value) - n + 1):
+                    grams.add(value[i:i + n])
+            for gram in grams:
+                rows = postings.get(gram)
+                if rows is None:
+                    rows = postings[gram] = set()
+                rows.add(row_id)
+
+        self._postings = postings
+        self.size = len(entries)
+
+    def candidates_for_literal(self, literal: str) -> Optional[Set[int]]:
+        """Row ids that may contain the literal in an indexed field
+
+        Returns None when the index cannot help (literal shorter than n);
+        an empty set means no row can match.
+        """
+        literal = literal.lower()
+        if len(literal) < self.n:
+            return None
+
+        result = None
+        for i in range(len(literal) - self.n + 1):
+            rows = self._postings.get(literal[i:i + self.n])
+            if not rows:
+                return set()
+            result = set(rows) if result is None else result & rows
+
+        return result
+
+    def candidates_for_pattern(self, pattern: str) -> Optional[Set[int]]:
+        """Row ids that may match a regex, via its required literal runs
+
+        Conservative: alternations and groups disable the index entirely,
+        and a literal followed by a quantifier loses its last character.
+        Returns None whenever no usable literal can be extracted.
+        """
+        if any(c in pattern for c in '|()'):
+            return None
+
+        literals = self._required_literals(pattern)
+        result = None
+        for literal in literals:
+            rows = self.candidates_for_literal(literal)
+            if rows is None:
+                continue
+            result = rows if result is None else result & rows
+
+        return result
+
+    def _required_literals(self, pattern: str) -> List[str]:
+        """Extract literal runs that any match must contain"""
+        literals = []
+        current = []
+        i = 0
+        while i < len(pattern):
+            char = pattern[i]
+            if char == '\\':
+                # Escaped character ends the literal run but does not make
+                # the preceding characters optional
+                if current:
+                    literals.append(''.join(current))
+                current = []
+                i += 2
+                continue
+            if char in _REGEX_METACHARS:
+                if char in '*?{' and current:
+                    # Quantifier applies to the previous char; it is optional
+                    current.pop()
+                if current:
+                    literals.append(''.join(current))
+                current = []
+                if char == '{':
+                    # The quantifier body is not text a match must contain;
+                    # skip through the closing brace
+                    end = pattern.find('}', i + 1)
+                    if end == -1:
+                        # Unclosed brace: stop extracting rather than guess
+                        break
+                    i = end + 1
+                    continue
+                if char == '[':
+                    # A character class matches one char from a set; its
+                    # contents are not required text either. Skip through
+                    # the closing bracket, minding escapes and the literal
+                    # ']' allowed right after '[' or '[^'
+                    j = i + 1
+                    if j < len(pattern) and pattern[j] == '^':
+                        j += 1
+                    if j < len(pattern) and pattern[j] == ']':
+                        j += 1
+                    while j < len(pattern) and pattern[j] != ']':
+                        j += 2 if pattern[j] == '\\' else 1
+                    if j >= len(pattern):
+                        # Unclosed class: stop extracting rather than guess
+                        break
+                    i = j + 1
+                    continue
+                i += 1
+                continue
+            current.append(char)
+            i += 1
+
+        if current:
+            literals.append(''.join(current))
+
+        return [literal for literal in literals if len(literal) >= self.n]
+
+    def candidates(self, condition) -> Optional[Set[int]]:
+        """Candidate row ids for a FilterCondition, or None if unusable
+
+        The returned set is a superset of the true matches; callers must
+        still verify candidates with the real condition.
+        """
+        if self.size == 0:
+            return None
+        if condition.field not in self.fields:
+            return None
+
+        if condition.operator in ('==', 'contains', 'startswith', 'endswith'):
+            return self.candidates_for_literal(condition.value)
+        if condition.operator == 'regex':
+            return self.candidates_for_pattern(condition.value)
+
+        return None
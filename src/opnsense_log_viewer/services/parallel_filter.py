@@ -11,7 +11,10 @@ from typing import List, Callable, Dict, Any, Tuple
 from concurrent.futures import ProcessPoolExecutor, as_completed
 import pickle
 
+import numpy as np
+
 from opnsense_log_viewer.services.log_parser import LogEntry
+from opnsense_log_viewer.services.log_filter import LogEntryTable, columns_condition_mask
 
 # Fix for PyInstaller multiprocessing
 if __name__ == '__main__':
@@ -215,22 +218,117 @@ class OptimizedFilterFunction:
         self.time_filter_enabled = time_filter_enabled
         self.time_range_start = time_range_start
         self.time_range_end = time_range_end
-    
+        # Compiled lazily (and dropped from pickles): a closure chain
+        # specialized to this exact filter set
+        self._predicate = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_predicate'] = None
+        return state
+
     def __call__(self, entry):
         """Evaluates the entry in an optimized way"""
-        # Time filter first (faster)
-        if self.time_filter_enabled:
-            if self.time_range_start and entry.timestamp < self.time_range_start:
+        predicate = self._predicate
+        if predicate is None:
+            predicate = self._predicate = self._compile_predicate()
+        return predicate(entry)
+
+    def _compile_predicate(self):
+        """Builds a closure specialized to the current filter parameters
+
+        Partial evaluation of the generic interpreter: field names,
+        match callables and negations are bound into per-condition
+        closures once, and the AND-only / OR-only operator chains
+        collapse into early-exit loops with no per-row dispatch.
+        """
+        checks = [
+            self._compile_check(condition, negate)
+            for condition, negate in zip(self.conditions, self.negations)
+        ]
+
+        time_start = self.time_range_start if self.time_filter_enabled else None
+        time_end = self.time_range_end if self.time_filter_enabled else None
+
+        if not checks:
+            if not (time_start or time_end):
+                return lambda entry: True
+
+            def predicate(entry):
+                timestamp = entry.timestamp
+                if time_start and timestamp < time_start:
+                    return False
+                if time_end and timestamp > time_end:
+                    return False
+                return True
+            return predicate
+
+        operators = self.operators
+        if all(op == 'AND' for op in operators):
+            def conditions_match(parsed_data):
+                for check in checks:
+                    if not check(parsed_data):
+                        return False
+                return True
+        elif all(op == 'OR' for op in operators):
+            def conditions_match(parsed_data):
+                for check in checks:
+                    if check(parsed_data):
+                        return True
                 return False
-            if self.time_range_end and entry.timestamp > self.time_range_end:
+        else:
+            def conditions_match(parsed_data, _checks=checks, _ops=operators):
+                result = _checks[0](parsed_data)
+                for i in range(1, len(_checks)):
+                    operator = _ops[i-1]
+                    # Short-circuit: False AND x and True OR x are already
+                    # decided, so skip evaluating the condition but keep
+                    # folding — a later operator can still flip the result
+                    if operator == 'AND' and not result:
+                        continue
+                    if operator == 'OR' and result:
+                        continue
+                    check_result = _checks[i](parsed_data)
+                    result = (result and check_result) if operator == 'AND' \
+                        else (result or check_result)
+                return result
+
+        if not (time_start or time_end):
+            return lambda entry: conditions_match(entry.parsed_data)
+
+        def predicate(entry):
+            timestamp = entry.timestamp
+            if time_start and timestamp < time_start:
                 return False
-        
-        # Advanced filters only if necessary
-        if not self.conditions:
-            return True
-        
-        # Optimized evaluation without unnecessary copies
-        return self._evaluate_conditions_fast(entry)
+            if time_end and timestamp > time_end:
+                return False
+            return conditions_match(entry.parsed_data)
+        return predicate
+
+    @staticmethod
+    def _compile_check(condition, negate):
+        """Binds one condition (field, matcher, negation) into a closure"""
+        match = condition._match_fn
+        field = condition.field
+
+        if field == 'interface':
+            def check(parsed_data):
+                return (match(parsed_data.get('interface', ''))
+                        or match(parsed_data.get('interface_display', '')))
+        elif field == '__label__':
+            def check(parsed_data):
+                return match(parsed_data.get('__rule_label__', ''))
+        else:
+            def check(parsed_data):
+                return match(parsed_data.get(field, ''))
+
+        if negate:
+            positive = check
+
+            def check(parsed_data):
+                return not positive(parsed_data)
+
+        return check
     
     def _evaluate_conditions_fast(self, entry):
         """Optimized evaluation of conditions"""
@@ -246,13 +344,13 @@ class OptimizedFilterFunction:
         for i in range(1, len(self.conditions)):
             operator = self.operators[i-1]
             
-            # Lazy evaluation for AND
+            # Short-circuit: False AND x and True OR x are already decided,
+            # so skip evaluating the condition but keep folding
             if operator == 'AND' and not result:
-                return False
-            # Lazy evaluation for OR
+                continue
             elif operator == 'OR' and result:
-                return True
-            
+                continue
+
             condition_result = self._evaluate_single_condition(self.conditions[i], entry)
             if self.negations[i]:
                 condition_result = not condition_result
@@ -264,13 +362,87 @@ class OptimizedFilterFunction:
         
         return result
     
+    def evaluate_batch(self, entries) -> np.ndarray:
+        """Evaluates a whole batch of entries as a vectorized boolean mask
+
+        Moves the per-entry inner loop into NumPy/pandas instead of Python
+        dispatch; used by chunk-at-a-time filtering paths.
+        """
+        if not entries:
+            return np.zeros(0, dtype=bool)
+
+        # Both backing layouts are built lazily: the integer-column fast
+        # path usually covers preset filters without a pandas table, and
+        # an expression with no conditions needs neither
+        table = None
+        cols = None
+
+        if not self.conditions:
+            mask = np.ones(len(entries), dtype=bool)
+        else:
+            # One mask per condition, fused into the accumulator in
+            # place so the peak is two N-row masks regardless of how
+            # many conditions are chained
+            mask = None
+            for i, condition in enumerate(self.conditions):
+                if cols is None:
+                    from opnsense_log_viewer.services.virtual_log_manager import LogColumns
+                    cols = LogColumns.from_entries(entries)
+
+                condition_mask = None
+                if condition.field != '__label__':
+                    condition_mask = columns_condition_mask(condition, cols)
+                if condition_mask is None:
+                    if table is None:
+                        table = LogEntryTable(entries)
+                    condition_mask = self._condition_mask(condition, table)
+
+                if self.negations[i]:
+                    condition_mask = ~condition_mask
+
+                if mask is None:
+                    mask = condition_mask
+                    if not mask.flags.writeable:
+                        mask = mask.copy()
+                elif self.operators[i-1] == 'AND':
+                    np.logical_and(mask, condition_mask, out=mask)
+                elif self.operators[i-1] == 'OR':
+                    np.logical_or(mask, condition_mask, out=mask)
+
+        if self.time_filter_enabled and (self.time_range_start or self.time_range_end):
+            if table is not None:
+                timestamps = table.timestamps
+                if self.time_range_start:
+                    np.logical_and(mask, (timestamps >= self.time_range_start).to_numpy(), out=mask)
+                if self.time_range_end:
+                    np.logical_and(mask, (timestamps <= self.time_range_end).to_numpy(), out=mask)
+            else:
+                if cols is None:
+                    from opnsense_log_viewer.services.virtual_log_manager import LogColumns
+                    cols = LogColumns.from_entries(entries)
+                if self.time_range_start:
+                    np.logical_and(mask, cols.ts >= int(self.time_range_start.timestamp()), out=mask)
+                if self.time_range_end:
+                    np.logical_and(mask, cols.ts <= int(self.time_range_end.timestamp()), out=mask)
+
+        return mask
+
+    def _condition_mask(self, condition, table):
+        """Vectorized mask for a condition, honoring the label redirect"""
+        if condition.field == '__label__':
+            return condition._column_mask(table.column('__rule_label__'))
+        return condition.evaluate_mask(table)
+
     def _evaluate_single_condition(self, condition, entry):
         """Evaluates a single condition in an optimized way"""
+        # Direct parsed_data access avoids the LogEntry.get wrapper frame
+        parsed_data = entry.parsed_data
+
         # Special handling for interface with mapping
         if condition.field == 'interface':
-            field_value = entry.get('interface', '')
-            interface_display = entry.get('interface_display', '')
-            
+            field_value = parsed_data.get('interface', '')
+            interface_display = parsed_data.get('interface_display', '')
+
             # Quick verification
             if self._check_value_match_fast(condition, field_value) or \
                self._check_value_match_fast(condition, interface_display):
@@ -278,10 +450,10 @@ class OptimizedFilterFunction:
             return False
         # Special handling for labels (uses pre-calculated label)
         elif condition.field == '__label__':
-            rule_label = entry.get('__rule_label__', '')
+            rule_label = parsed_data.get('__rule_label__', '')
             return self._check_value_match_fast(condition, rule_label)
         else:
-            field_value = entry.get(condition.field, '')
+            field_value = parsed_data.get(condition.field, '')
             return self._check_value_match_fast(condition, field_value)
     
     def _check_value_match_fast(self, condition, field_value):
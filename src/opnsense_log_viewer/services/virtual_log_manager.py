@@ -2,13 +2,140 @@
 Virtual Log Manager - Memory-optimized log manager
 Streaming system with LRU cache to handle multi-GB log files
 """
+import array
+import concurrent.futures
+import mmap
 import os
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 import threading
 from collections import OrderedDict
 
-from opnsense_log_viewer.services.log_parser import OPNsenseLogParser, LogEntry
+import numpy as np
+
+# The enum encodings live with the parser so codes are assigned once at
+# parse time; re-exported here for the column/filter consumers
+from opnsense_log_viewer.services.log_parser import (
+    OPNsenseLogParser, LogEntry,
+    ACTION_OTHER, ACTION_PASS, ACTION_BLOCK, ACTION_RDR, ACTION_CODES,
+    PROTO_OTHER, PROTO_TCP, PROTO_UDP, PROTO_ICMP, PROTO_CODES,
+)
+
+def pack_ipv4(text: str) -> int:
+    """Packs a dotted-quad IPv4 string into a uint32 (0 when not IPv4)"""
+    parts = text.split('.')
+    if len(parts) != 4:
+        return 0
+    try:
+        a, b, c, d = (int(p) for p in parts)
+    except ValueError:
+        return 0
+    if a > 255 or b > 255 or c > 255 or d > 255:
+        return 0
+    return (a << 24) | (b << 16) | (c << 8) | d
+
+class LogColumns:
+    """Struct-of-arrays view of a block of log entries
+
+    One NumPy array per hot column (timestamps as int64 epoch seconds,
+    action/proto as uint8 enums, addresses as packed uint32 IPv4, ports
+    as uint32) so filters run as vectorized masks instead of per-row
+    attribute lookups on LogEntry objects.
+    """
+
+    __slots__ = ('ts', 'action', 'proto', 'src', 'dst', 'srcport', 'dstport')
+
+    def __init__(self, ts, action, proto, src, dst, srcport, dstport):
+        self.ts = ts
+        self.action = action
+        self.proto = proto
+        self.src = src
+        self.dst = dst
+        self.srcport = srcport
+        self.dstport = dstport
+
+    def __len__(self):
+        return len(self.ts)
+
+    @classmethod
+    def empty(cls) -> 'LogColumns':
+        """Returns a zero-row column set"""
+        return cls.from_entries([])
+
+    def take(self, order: np.ndarray) -> 'LogColumns':
+        """Returns a reordered copy via fancy indexing on each column"""
+        return LogColumns(
+            self.ts[order], self.action[order], self.proto[order],
+            self.src[order], self.dst[order],
+            self.srcport[order], self.dstport[order]
+        )
+
+    @classmethod
+    def from_entries(cls, entries: List[LogEntry]) -> 'LogColumns':
+        """Builds column arrays from parsed LogEntry objects"""
+        count = len(entries)
+        ts = np.zeros(count, dtype=np.int64)
+        action = np.zeros(count, dtype=np.uint8)
+        proto = np.zeros(count, dtype=np.uint8)
+        src = np.zeros(count, dtype=np.uint32)
+        dst = np.zeros(count, dtype=np.uint32)
+        srcport = np.zeros(count, dtype=np.uint32)
+        dstport = np.zeros(count, dtype=np.uint32)
+
+        action_codes = ACTION_CODES
+        proto_codes = PROTO_CODES
+
+        for i, entry in enumerate(entries):
+            parsed = entry.parsed_data
+            if entry.timestamp:
+                ts[i] = int(entry.timestamp.timestamp())
+            # Codes are precomputed at parse time; map the strings only
+            # for entries built outside the parser
+            code = parsed.get('__action_code__')
+            if code is None:
+                code = action_codes.get(parsed.get('action', ''), ACTION_OTHER)
+            action[i] = code
+            code = parsed.get('__proto_code__')
+            if code is None:
+                code = proto_codes.get(parsed.get('protoname', ''), PROTO_OTHER)
+            proto[i] = code
+            src[i] = pack_ipv4(parsed.get('src', '') or '')
+            dst[i] = pack_ipv4(parsed.get('dst', '') or '')
+            try:
+                srcport[i] = int(parsed.get('srcport', '') or 0)
+            except ValueError:
+                pass
+            try:
+                dstport[i] = int(parsed.get('dstport', '') or 0)
+            except ValueError:
+                pass
+
+        return cls(ts, action, proto, src, dst, srcport, dstport)
+
+def _index_byte_range(args):
+    """Indexes newline offsets in a byte range (module-level function for
+    multiprocessing compatibility)
+
+    Each worker owns its own read-only mmap of the file and returns the
+    absolute offsets of the line starts that follow each newline in
+    [start, end). Newlines are scanned by position, so boundary lines are
+    attributed to exactly one range and no snapping pass is needed.
+    """
+    file_path, start, end = args
+
+    offsets = array.array('q')
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            find = mm.find
+            pos = start
+            while True:
+                newline = find(b'\n', pos, end)
+                if newline == -1:
+                    break
+                pos = newline + 1
+                offsets.append(pos)
+
+    return offsets
 
 class LRUCache:
     """Simple LRU cache for log chunks"""
@@ -55,48 +182,228 @@ class LRUCache:
 
 class LogFileIndex:
     """Index of a log file for fast line access"""
-    
+
+    # Below this size the process-pool startup costs more than it saves
+    PARALLEL_INDEX_MIN_SIZE = 64 * 1024 * 1024
+
+    # Sidecar cache of line offsets; files smaller than this re-index
+    # faster than they deserialize, and the sidecar is not worth the
+    # directory clutter
+    SIDECAR_SUFFIX = '.lvidx'
+    SIDECAR_MAGIC = b'LVIDX1\n'
+    SIDECAR_MIN_SIZE = 4 * 1024 * 1024
+
     def __init__(self, file_path: str):
         self.file_path = file_path
-        self.line_offsets = []  # Offset of each line in the file
+        # array('q') keeps offsets at 8 bytes each instead of a list of ints
+        self.line_offsets = array.array('q', [0])  # Offset of each line in the file
         self.total_lines = 0
         self.file_size = 0
         self.index_built = False
         self.lock = threading.Lock()
-        
+        self._mmap = None
+        self._mmap_file = None
+
     def build_index(self, progress_callback=None):
         """Builds the line position index"""
         if self.index_built:
             return
-            
+
         with self.lock:
             if self.index_built:  # Double-check
                 return
-                
-            self.line_offsets = [0]  # First line starts at 0
+
+            self.line_offsets = array.array('q', [0])  # First line starts at 0
             self.file_size = os.path.getsize(self.file_path)
-            
-            with open(self.file_path, 'rb') as f:
-                offset = 0
+
+            if self.file_size == 0:
+                self.total_lines = 0
+                self.index_built = True
+                if progress_callback:
+                    progress_callback("Index complete: 0 lines")
+                return
+
+            if self._load_sidecar():
+                if progress_callback:
+                    progress_callback(f"Index restored: {self.total_lines:,} lines")
+                return
+
+            workers = os.cpu_count() or 1
+            if self.file_size >= self.PARALLEL_INDEX_MIN_SIZE and workers > 1:
+                if self._build_index_parallel(workers, progress_callback):
+                    self._save_sidecar()
+                    return
+
+            self._build_index_sequential(progress_callback)
+            self._save_sidecar()
+
+    def _sidecar_path(self) -> str:
+        return self.file_path + self.SIDECAR_SUFFIX
+
+    def _load_sidecar(self) -> bool:
+        """Restores the offset index from the sidecar file if still valid
+
+        The sidecar is keyed by (size, mtime_ns); any mismatch — or any
+        structural inconsistency — falls back to a fresh scan.
+        """
+        try:
+            stat = os.stat(self.file_path)
+            with open(self._sidecar_path(), 'rb') as f:
+                if f.read(len(self.SIDECAR_MAGIC)) != self.SIDECAR_MAGIC:
+                    return False
+                size, mtime_ns, count = (int(v) for v in f.readline().split())
+                if size != stat.st_size or mtime_ns != stat.st_mtime_ns or count < 2:
+                    return False
+                offsets = array.array('q')
+                offsets.fromfile(f, count)
+        except (OSError, ValueError, EOFError):
+            return False
+
+        if offsets[0] != 0 or offsets[-1] != size:
+            return False
+
+        self.line_offsets = offsets
+        self.total_lines = count - 1
+        self.index_built = True
+        return True
+
+    def _save_sidecar(self):
+        """Writes the offset index next to the log file (best effort)
+
+        fsync + atomic rename, so a crash mid-write never leaves a
+        truncated sidecar that a later open would trust.
+        """
+        if self.file_size < self.SIDECAR_MIN_SIZE:
+            return
+
+        temp_path = self._sidecar_path() + '.tmp'
+        try:
+            stat = os.stat(self.file_path)
+            with open(temp_path, 'wb') as f:
+                f.write(self.SIDECAR_MAGIC)
+                f.write(f'{stat.st_size} {stat.st_mtime_ns} {len(self.line_offsets)}\n'.encode('ascii'))
+                self.line_offsets.tofile(f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self._sidecar_path())
+        except OSError:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+    def _build_index_sequential(self, progress_callback=None):
+        """Single-threaded index build over a read-only mmap"""
+        # Scan newline positions on a read-only mmap: the kernel page
+        # cache is read directly without copying lines into Python bytes
+        with open(self.file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                self._advise(mm, 'MADV_SEQUENTIAL')
+
+                find = mm.find
+                offsets = self.line_offsets
+                size = self.file_size
+                pos = 0
                 line_count = 0
-                
-                while True:
-                    line = f.readline()
-                    if not line:
-                        break
-                    
-                    offset += len(line)
-                    self.line_offsets.append(offset)
+
+                while pos < size:
+                    newline = find(b'\n', pos)
+                    pos = size if newline == -1 else newline + 1
+                    offsets.append(pos)
                     line_count += 1
-                    
+
                     if progress_callback and line_count % 10000 == 0:
                         progress_callback(f"Indexing: {line_count:,} lines processed...")
-                
+
                 self.total_lines = line_count
                 self.index_built = True
-                
+
                 if progress_callback:
                     progress_callback(f"Index complete: {self.total_lines:,} lines")
+
+    def _build_index_parallel(self, workers, progress_callback=None):
+        """Indexes byte ranges in parallel with a process pool
+
+        Splits the file into one byte range per core and merges the
+        per-range offset arrays in file order. Returns False when the pool
+        cannot be used so the caller falls back to the sequential scan.
+
+        Processes rather than threads: mmap.find holds the GIL, so
+        threads scanning disjoint ranges would still serialize. The IPC
+        cost is one compact offset array per range, which stays small
+        relative to the scan itself.
+        """
+        range_size = (self.file_size + workers - 1) // workers
+        worker_args = [
+            (self.file_path, start, min(start + range_size, self.file_size))
+            for start in range(0, self.file_size, range_size)
+        ]
+
+        if progress_callback:
+            progress_callback(f"Indexing with {len(worker_args)} cores...")
+
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                bytes_indexed = 0
+                # executor.map preserves range order, so offsets concatenate
+                # directly into file order
+                for args, part in zip(worker_args, executor.map(_index_byte_range, worker_args)):
+                    self.line_offsets.extend(part)
+                    bytes_indexed += args[2] - args[1]
+                    if progress_callback:
+                        progress = (bytes_indexed / self.file_size) * 100
+                        progress_callback(f"Indexing: {progress:.0f}%")
+        except Exception:
+            self.line_offsets = array.array('q', [0])
+            return False
+
+        # A final line without a trailing newline still needs its end offset
+        if self.line_offsets[-1] != self.file_size:
+            self.line_offsets.append(self.file_size)
+
+        self.total_lines = len(self.line_offsets) - 1
+        self.index_built = True
+
+        if progress_callback:
+            progress_callback(f"Index complete: {self.total_lines:,} lines")
+
+        return True
+
+    @staticmethod
+    def _advise(mm, advice_name):
+        """Passes a madvise hint when the platform supports it"""
+        advice = getattr(mmap, advice_name, None)
+        if advice is not None:
+            try:
+                mm.madvise(advice)
+            except (OSError, ValueError):
+                pass
+
+    def read_slice(self, start_offset: int, size: int) -> bytes:
+        """Reads a byte range through a persistent read-only mmap
+
+        Page reads fault in only the touched pages, so resident memory
+        stays proportional to what is actually viewed.
+        """
+        if size <= 0:
+            return b''
+
+        with self.lock:
+            if self._mmap is None:
+                self._mmap_file = open(self.file_path, 'rb')
+                self._mmap = mmap.mmap(self._mmap_file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._advise(self._mmap, 'MADV_RANDOM')
+            return self._mmap[start_offset:start_offset + size]
+
+    def close(self):
+        """Releases the mmap and its underlying file handle"""
+        with self.lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            if self._mmap_file is not None:
+                self._mmap_file.close()
+                self._mmap_file = None
     
     def get_line_range(self, start_line: int, count: int) -> Tuple[int, int]:
         """Returns the start offset and size for a line range"""
@@ -128,6 +435,9 @@ class VirtualLogManager:
         self.cache.clear()
         self.filtered_indices = []
         self.is_filtered = False
+
+        if self.file_index is not None:
+            self.file_index.close()
         
         # Build the file index
         if progress_callback:
@@ -161,20 +471,17 @@ class VirtualLogManager:
         start_offset, size = self.file_index.get_line_range(start_line, self.chunk_size)
         
         if size > 0:
-            with open(self.current_file, 'r', encoding='utf-8', errors='ignore') as f:
-                f.seek(start_offset)
-                lines_read = 0
-                
-                while lines_read < self.chunk_size:
-                    line = f.readline()
-                    if not line:
-                        break
-                        
-                    # Parse the line
-                    entry = self.log_parser.parse_log_line(line.strip())
-                    if entry:
-                        chunk_entries.append(entry)
-                    lines_read += 1
+            # Slice the chunk straight out of the mmap instead of seeking
+            # a buffered text file
+            raw_chunk = self.file_index.read_slice(start_offset, size)
+            for raw_line in raw_chunk.splitlines()[:self.chunk_size]:
+                entry = self.log_parser.parse_log_line(
+                    # latin-1 decode is a plain byte copy — no validation
+                    # branches, which matters in this per-line hot loop
+                    raw_line.decode('latin-1').strip()
+                )
+                if entry:
+                    chunk_entries.append(entry)
         
         # Cache it
         self.cache.put(cache_key, chunk_entries)
@@ -264,10 +571,6 @@ class VirtualLogManager:
             
     def _apply_threaded_filter(self, filter_func, progress_callback=None):
         """High-performance threaded filtering to improve performance"""
-        import concurrent.futures
-        import threading
-        import os
-        
         # Intelligent detection of optimal thread count
         def get_optimal_thread_count():
             """Determines the optimal number of threads based on system resources"""
@@ -318,8 +621,6 @@ class VirtualLogManager:
         def process_lines_batch(start_idx, end_idx):
             """Processes a batch of lines in a thread"""
             local_indices = []
-            # Import locally to avoid conflicts
-            from opnsense_log_viewer.services.log_parser import OPNsenseLogParser
             local_parser = OPNsenseLogParser()  # Local parser to avoid conflicts
             
             try:
@@ -387,11 +688,19 @@ class VirtualLogManager:
             
             chunk = self.get_chunk(chunk_id)
             chunk_start_index = chunk_id * self.chunk_size
-            
-            for i, entry in enumerate(chunk):
-                if filter_func(entry):
-                    self.filtered_indices.append(chunk_start_index + i)
-                processed_entries += 1
+
+            if hasattr(filter_func, 'evaluate_batch'):
+                # Vectorized chunk-at-a-time evaluation
+                mask = filter_func.evaluate_batch(chunk)
+                for i, keep in enumerate(mask):
+                    if keep:
+                        self.filtered_indices.append(chunk_start_index + i)
+                processed_entries += len(chunk)
+            else:
+                for i, entry in enumerate(chunk):
+                    if filter_func(entry):
+                        self.filtered_indices.append(chunk_start_index + i)
+                    processed_entries += 1
         
         self.is_filtered = True
         
@@ -1,6 +1,7 @@
 """
 Utility functions for file operations with error handling.
 """
+import mmap
 import os
 
 from opnsense_log_viewer.exceptions import FileOperationError
@@ -37,33 +38,34 @@ def read_file_tail(file_path, num_lines):
     logger.debug(f"Reading last {num_lines} lines from {file_path}")
 
     try:
-        with open(file_path, 'rb') as f:
-            # Go to end of file
-            f.seek(0, 2)  # Seek to end
-            file_size = f.tell()
-
-            # Read chunks from end until we have enough lines
-            lines = []
-            chunk_size = 8192  # 8KB chunks
-            pos = file_size
-
-            while len(lines) < num_lines and pos > 0:
-                # Calculate chunk position
-                chunk_start = max(0, pos - chunk_size)
-                chunk_size_actual = pos - chunk_start
-
-                # Read chunk
-                f.seek(chunk_start)
-                chunk = f.read(chunk_size_actual).decode('utf-8', errors='ignore')
+        if num_lines <= 0 or os.path.getsize(file_path) == 0:
+            return []
 
-                # Split into lines and prepend to our list
-                chunk_lines = chunk.split('\n')
-                lines = chunk_lines + lines
-
-                pos = chunk_start
-
-            # Return last num_lines
-            return lines[-num_lines:] if len(lines) > num_lines else lines
+        with open(file_path, 'rb') as f:
+            # Walk newlines backwards with mmap.rfind: one C-level scan
+            # per line break instead of chunked reads and list splicing,
+            # and only the tail pages are ever touched
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = len(mm)
+                if mm[end - 1] == 0x0A:
+                    # Trailing newline terminates the last line, it does
+                    # not start an empty one
+                    end -= 1
+                if end == 0:
+                    return ['']
+
+                start = 0
+                pos = end
+                for _ in range(num_lines):
+                    newline = mm.rfind(b'\n', 0, pos)
+                    if newline == -1:
+                        start = 0
+                        break
+                    start = newline + 1
+                    pos = newline
+
+                # latin-1: validation-free decode; log lines are ASCII
+                return mm[start:end].decode('latin-1').split('\n')
 
     except PermissionError as e:
         error_msg = f"Permission denied reading file: {file_path}"
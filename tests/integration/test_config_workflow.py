@@ -297,8 +297,9 @@ class TestConfigWorkflow:
         config_parser = OPNsenseConfigParser()
         _, port_aliases = config_parser.parse_aliases_from_xml(str(xml_path))
 
-        # Should expand range
-        assert '8080' in port_aliases
-        assert '8082' in port_aliases
-        assert '8085' in port_aliases
-        assert all(port_aliases[str(p)] == 'HighPorts' for p in range(8080, 8086) if str(p) in port_aliases)
+        # Range is kept as an interval; lookups resolve any port inside it
+        assert port_aliases == {}
+        assert (8080, 8085, 'HighPorts') in config_parser.port_alias_ranges
+        assert all(config_parser.get_port_alias(str(p)) == 'HighPorts'
+                   for p in range(8080, 8086))
+        assert config_parser.get_port_alias('8086') is None
@@ -216,21 +216,24 @@ class TestOPNsenseConfigParser:
         port_aliases = {}
         config_parser._process_port_alias('HighPorts', '8080:8090', port_aliases)
 
-        # Should expand the range
-        assert '8080' in port_aliases
-        assert '8085' in port_aliases
-        assert '8090' in port_aliases
-        assert len([k for k in port_aliases if port_aliases[k] == 'HighPorts']) == 11
+        # Ranges are stored as intervals, not expanded into the dict
+        assert port_aliases == {}
+        assert (8080, 8090, 'HighPorts') in config_parser.port_alias_ranges
+        assert config_parser.get_port_alias('8080') == 'HighPorts'
+        assert config_parser.get_port_alias('8085') == 'HighPorts'
+        assert config_parser.get_port_alias('8090') == 'HighPorts'
+        assert config_parser.get_port_alias('8091') is None
 
     def test_process_port_alias_range_dash(self, config_parser):
         """Test processing port range with dash separator."""
         port_aliases = {}
         config_parser._process_port_alias('HighPorts', '8080-8090', port_aliases)
 
-        # Should expand the range
-        assert '8080' in port_aliases
-        assert '8085' in port_aliases
-        assert '8090' in port_aliases
+        assert port_aliases == {}
+        assert config_parser.get_port_alias('8080') == 'HighPorts'
+        assert config_parser.get_port_alias('8085') == 'HighPorts'
+        assert config_parser.get_port_alias('8090') == 'HighPorts'
+        assert config_parser.get_port_alias('8079') is None
 
     def test_process_port_alias_invalid_range(self, config_parser):
         """Test processing invalid port range."""
@@ -453,6 +453,61 @@ class TestLogFilter:
 
         assert filtered == []
 
+    def test_filter_entries_batched(self, log_filter, log_entry_factory):
+        """Test streaming batch filtering yields one mask per batch."""
+        log_filter.add_filter_condition('action', '==', 'pass')
+
+        batches = [
+            [log_entry_factory(action='pass'), log_entry_factory(action='block')],
+            [log_entry_factory(action='block')],
+            [],
+        ]
+
+        masks = list(log_filter.filter_entries_batched(batches))
+
+        assert len(masks) == 3
+        assert list(masks[0]) == [True, False]
+        assert list(masks[1]) == [False]
+        assert len(masks[2]) == 0
+
+    def test_apply_vectorized_cidr(self, log_filter, log_entry_factory):
+        """Test vectorized CIDR/prefix matching over packed columns."""
+        from opnsense_log_viewer.services.virtual_log_manager import LogColumns
+
+        entries = [
+            log_entry_factory(src='192.168.1.10'),
+            log_entry_factory(src='10.0.0.5'),
+        ]
+        cols = LogColumns.from_entries(entries)
+
+        log_filter.add_filter_condition('src', '==', '192.168.0.0/16')
+        mask = log_filter.apply_vectorized(cols)
+        assert list(mask) == [True, False]
+
+        log_filter.clear_filters()
+        log_filter.add_filter_condition('src', 'startswith', '10.')
+        mask = log_filter.apply_vectorized(cols)
+        assert list(mask) == [False, True]
+
+        log_filter.clear_filters()
+        log_filter.add_filter_condition('interface', 'contains', 'em')
+        assert log_filter.apply_vectorized(cols) is None
+
+    def test_or_joined_regex_filters(self, log_filter, log_entry_factory):
+        """Test OR-joined regex conditions on one field match correctly."""
+        entries = [
+            log_entry_factory(src='192.168.1.10'),
+            log_entry_factory(src='10.0.0.5'),
+            log_entry_factory(src='172.16.3.3'),
+        ]
+
+        log_filter.add_filter_condition('src', 'regex', r'^192\.')
+        log_filter.add_filter_condition('src', 'regex', r'^10\.', logic_operator='OR')
+
+        filtered = log_filter.filter_entries(entries)
+
+        assert [e.get('src') for e in filtered] == ['192.168.1.10', '10.0.0.5']
+
     def test_filter_case_sensitive(self, log_filter, log_entry_factory):
         """Test case-sensitive filtering."""
         log_filter.add_filter_condition('action', '==', 'PASS', case_sensitive=True)
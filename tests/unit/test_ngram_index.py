@@ -0,0 +1,154 @@
+"""
+Unit tests for the trigram inverted index.
+"""
+import pytest
+
+from opnsense_log_viewer.services.ngram_index import NGramIndex
+from opnsense_log_viewer.services.log_filter import FilterCondition, LogFilter
+
+
+@pytest.mark.unit
+class TestNGramIndex:
+    """Test NGramIndex class."""
+
+    def test_build_empty(self):
+        """Test building an index over no entries."""
+        index = NGramIndex()
+        index.build([])
+        assert index.size == 0
+
+    def test_candidates_for_literal(self, log_entry_factory):
+        """Test candidate lookup for a plain literal."""
+        entries = [
+            log_entry_factory(src='192.168.1.100'),
+            log_entry_factory(src='10.0.0.50'),
+            log_entry_factory(src='192.168.2.200'),
+        ]
+        index = NGramIndex()
+        index.build(entries)
+
+        candidates = index.candidates_for_literal('192.168')
+        assert candidates == {0, 2}
+
+        candidates = index.candidates_for_literal('172.16')
+        assert candidates == set()
+
+    def test_short_literal_unusable(self, log_entry_factory):
+        """Test that literals shorter than n cannot use the index."""
+        index = NGramIndex()
+        index.build([log_entry_factory()])
+
+        assert index.candidates_for_literal('19') is None
+
+    def test_candidates_case_insensitive(self, log_entry_factory):
+        """Test that the index folds case."""
+        entries = [log_entry_factory(action='PASS')]
+        index = NGramIndex()
+        index.build(entries)
+
+        assert index.candidates_for_literal('pass') == {0}
+
+    def test_candidates_for_pattern(self, log_entry_factory):
+        """Test candidate lookup from regex literal runs."""
+        entries = [
+            log_entry_factory(src='192.168.1.100'),
+            log_entry_factory(src='10.0.0.50'),
+        ]
+        index = NGramIndex()
+        index.build(entries)
+
+        candidates = index.candidates_for_pattern(r'^192\.')
+        assert candidates == {0}
+
+    def test_pattern_with_brace_quantifier(self, log_entry_factory):
+        """Test that a {m,n} quantifier body is not treated as a literal."""
+        entries = [
+            log_entry_factory(src='192.168.1.100'),
+            log_entry_factory(src='10.0.0.50'),
+        ]
+        index = NGramIndex()
+        index.build(entries)
+
+        log_filter = LogFilter()
+        log_filter.add_filter_condition('src', 'regex', r'192\.168\.\d{1,3}\.100')
+
+        # Indexed and unindexed filtering must agree
+        assert (log_filter.filter_entries(entries, index=index)
+                == log_filter.filter_entries(entries)
+                == [entries[0]])
+
+    def test_pattern_with_character_class(self, log_entry_factory):
+        """Test that character-class contents are not treated as literals."""
+        entries = [
+            log_entry_factory(src='abcdef'),
+            log_entry_factory(src='adef.example'),
+        ]
+        index = NGramIndex()
+        index.build(entries)
+
+        # 'abc' is one char from a set, not text a match must contain
+        assert index._required_literals('[abc]def') == ['def']
+
+        log_filter = LogFilter()
+        log_filter.add_filter_condition('src', 'regex', '[abc]def')
+
+        # Indexed and unindexed filtering must agree
+        assert (log_filter.filter_entries(entries, index=index)
+                == log_filter.filter_entries(entries)
+                == entries)
+
+    def test_pattern_with_alternation_unusable(self, log_entry_factory):
+        """Test that alternation disables the index."""
+        index = NGramIndex()
+        index.build([log_entry_factory()])
+
+        assert index.candidates_for_pattern('pass|block') is None
+
+    def test_candidates_for_condition(self, log_entry_factory):
+        """Test condition-level candidate lookup."""
+        entries = [
+            log_entry_factory(dst='10.0.0.50'),
+            log_entry_factory(dst='8.8.8.8'),
+        ]
+        index = NGramIndex()
+        index.build(entries)
+
+        condition = FilterCondition('dst', 'contains', '10.0.0')
+        assert index.candidates(condition) == {0}
+
+        # Unindexed fields cannot use the index
+        condition = FilterCondition('protoname', '==', 'tcp')
+        assert index.candidates(condition) is None
+
+    def test_filter_entries_with_index(self, log_entry_factory):
+        """Test LogFilter narrowing through the index."""
+        entries = [
+            log_entry_factory(src='192.168.1.100', action='pass'),
+            log_entry_factory(src='10.0.0.50', action='block'),
+            log_entry_factory(src='192.168.1.100', action='block'),
+        ]
+        index = NGramIndex()
+        index.build(entries)
+
+        log_filter = LogFilter()
+        log_filter.add_filter_condition('src', 'contains', '192.168')
+        log_filter.add_filter_condition('action', '==', 'block')
+
+        filtered = log_filter.filter_entries(entries, index=index)
+        assert filtered == [entries[2]]
+
+    def test_filter_entries_or_ignores_index(self, log_entry_factory):
+        """Test that OR expressions do not use the candidate set."""
+        entries = [
+            log_entry_factory(src='192.168.1.100', action='pass'),
+            log_entry_factory(src='10.0.0.50', action='block'),
+        ]
+        index = NGramIndex()
+        index.build(entries)
+
+        log_filter = LogFilter()
+        log_filter.add_filter_condition('src', 'contains', '192.168')
+        log_filter.add_filter_condition('action', '==', 'block', logic_operator='OR')
+
+        filtered = log_filter.filter_entries(entries, index=index)
+        assert filtered == entries
@@ -0,0 +1,71 @@
+"""
+Unit tests for OptimizedFilterFunction evaluator parity.
+"""
+import pytest
+
+from opnsense_log_viewer.services.log_filter import LogFilter
+from opnsense_log_viewer.services.parallel_filter import OptimizedFilterFunction
+
+
+def _entry_for_pattern(log_entry_factory, pattern):
+    """Build an entry whose three fields match/miss per the truth pattern."""
+    c1, c2, c3 = pattern
+    return log_entry_factory(
+        action='pass' if c1 else 'block',
+        protoname='tcp' if c2 else 'udp',
+        interface='em0' if c3 else 'wan',
+    )
+
+
+def _mixed_filter(first_op, second_op):
+    """action == pass <first_op> protoname == tcp <second_op> interface == em0"""
+    log_filter = LogFilter()
+    log_filter.add_filter_condition('action', '==', 'pass')
+    log_filter.add_filter_condition('protoname', '==', 'tcp', first_op)
+    log_filter.add_filter_condition('interface', '==', 'em0', second_op)
+    return log_filter
+
+
+class TestMixedOperatorParity:
+    """Compiled predicate must agree with the sequential and batch evaluators.
+
+    Mixed AND/OR chains fold left to right, so a short-circuit may skip
+    evaluating a condition but must never end the fold early — a later
+    operator can still flip the outcome. Single-operator chains cannot
+    expose that, hence the exhaustive mixed-chain checks here.
+    """
+
+    def test_or_then_and_regression(self, log_entry_factory):
+        """(T OR F) AND F must be False, not short-circuited to True."""
+        log_filter = _mixed_filter('OR', 'AND')
+        optimized = OptimizedFilterFunction(log_filter)
+        entry = _entry_for_pattern(log_entry_factory, (True, False, False))
+
+        assert log_filter.expression.evaluate(entry) == False
+        assert optimized(entry) == False
+        assert optimized.evaluate_batch([entry])[0] == False
+
+    def test_and_then_or_regression(self, log_entry_factory):
+        """(F AND F) OR T must be True, not short-circuited to False."""
+        log_filter = _mixed_filter('AND', 'OR')
+        optimized = OptimizedFilterFunction(log_filter)
+        entry = _entry_for_pattern(log_entry_factory, (False, False, True))
+
+        assert log_filter.expression.evaluate(entry) == True
+        assert optimized(entry) == True
+        assert optimized.evaluate_batch([entry])[0] == True
+
+    @pytest.mark.parametrize('first_op,second_op', [
+        ('AND', 'OR'), ('OR', 'AND'),
+    ])
+    def test_all_truth_patterns_agree(self, log_entry_factory, first_op, second_op):
+        """All three evaluators agree on every truth combination."""
+        log_filter = _mixed_filter(first_op, second_op)
+        optimized = OptimizedFilterFunction(log_filter)
+
+        patterns = [(bool(i & 4), bool(i & 2), bool(i & 1)) for i in range(8)]
+        entries = [_entry_for_pattern(log_entry_factory, p) for p in patterns]
+
+        expected = [log_filter.expression.evaluate(e) for e in entries]
+        assert [optimized(e) for e in entries] == expected
+        assert list(optimized.evaluate_batch(entries)) == expected